@@ -4,6 +4,7 @@
 처리 결과물의 품질을 종합적으로 평가
 """
 import json
+import time
 import asyncio
 from pathlib import Path
 from datetime import datetime
@@ -23,23 +24,28 @@ class PipelineQualityAssessment:
         print("=" * 60)
 
         document_name = Path(document_path).name
+        now_iso = datetime.now().isoformat()
         self.assessment_report = {
             "document": document_name,
-            "timestamp": datetime.now().isoformat(),
-            "assessments": {}
+            "timestamp": now_iso,
+            # 평가 항목 슬롯을 미리 확보 (실패한 항목도 같은 키 순서 유지)
+            "assessments": dict.fromkeys(
+                ("basic_processing", "template_system", "hybrid_system", "output_quality")
+            )
         }
+        assessments = self.assessment_report["assessments"]
 
         # 1. 기본 처리 성능 평가
-        await self._assess_basic_processing(document_path)
+        assessments["basic_processing"] = await self._assess_basic_processing(document_path)
 
         # 2. 템플릿 시스템 평가
-        await self._assess_template_system(document_path)
+        assessments["template_system"] = await self._assess_template_system(document_path)
 
         # 3. 하이브리드 시스템 평가
-        await self._assess_hybrid_system(document_path)
+        assessments["hybrid_system"] = await self._assess_hybrid_system(document_path)
 
         # 4. 출력 품질 평가
-        self._assess_output_quality()
+        assessments["output_quality"] = self._assess_output_quality()
 
         # 5. 전체 점수 계산
         self._calculate_overall_score()
@@ -63,10 +69,9 @@ class PipelineQualityAssessment:
         )
 
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             result = await pipeline.process_document(document_path, config)
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
 
             basic_assessment = {
                 "processing_time": processing_time,
@@ -96,11 +101,11 @@ class PipelineQualityAssessment:
             print(f"   🏗️ 구조 점수: {structure_score:.1f}/100")
             print(f"   📊 전체 점수: {basic_assessment['overall_score']:.1f}/100")
 
-            self.assessment_report["assessments"]["basic_processing"] = basic_assessment
+            return basic_assessment
 
         except Exception as e:
             print(f"   ❌ 기본 처리 실패: {e}")
-            self.assessment_report["assessments"]["basic_processing"] = {
+            return {
                 "success": False,
                 "error": str(e),
                 "overall_score": 0
@@ -151,11 +156,11 @@ class PipelineQualityAssessment:
                 print(f"   🔍 매칭 필드: {template_assessment['matched_fields']}개")
             print(f"   📊 템플릿 점수: {template_score:.1f}/100")
 
-            self.assessment_report["assessments"]["template_system"] = template_assessment
+            return template_assessment
 
         except Exception as e:
             print(f"   ❌ 템플릿 평가 실패: {e}")
-            self.assessment_report["assessments"]["template_system"] = {
+            return {
                 "success": False,
                 "error": str(e),
                 "overall_score": 0
@@ -219,11 +224,11 @@ class PipelineQualityAssessment:
             print(f"   📊 추출률: {extraction_rate:.1f}%")
             print(f"   📊 하이브리드 점수: {hybrid_score:.1f}/100")
 
-            self.assessment_report["assessments"]["hybrid_system"] = hybrid_assessment
+            return hybrid_assessment
 
         except Exception as e:
             print(f"   ❌ 하이브리드 평가 실패: {e}")
-            self.assessment_report["assessments"]["hybrid_system"] = {
+            return {
                 "success": False,
                 "error": str(e),
                 "overall_score": 0
@@ -291,11 +296,11 @@ class PipelineQualityAssessment:
             print(f"   🔒 파일 무결성: {'✅' if output_assessment['file_integrity'] else '❌'}")
             print(f"   📊 출력 품질 점수: {output_score:.1f}/100")
 
-            self.assessment_report["assessments"]["output_quality"] = output_assessment
+            return output_assessment
 
         except Exception as e:
             print(f"   ❌ 출력 평가 실패: {e}")
-            self.assessment_report["assessments"]["output_quality"] = {
+            return {
                 "success": False,
                 "error": str(e),
                 "overall_score": 0
@@ -305,7 +310,6 @@ class PipelineQualityAssessment:
         """전체 점수 계산"""
         assessments = self.assessment_report["assessments"]
 
-        scores = []
         weights = {
             "basic_processing": 0.25,
             "template_system": 0.35,
@@ -313,16 +317,20 @@ class PipelineQualityAssessment:
             "output_quality": 0.10
         }
 
-        total_weight = 0
-        weighted_sum = 0
-
-        for component, weight in weights.items():
-            if component in assessments and "overall_score" in assessments[component]:
-                score = assessments[component]["overall_score"]
-                weighted_sum += score * weight
-                total_weight += weight
+        # 점수가 있는 컴포넌트만 한 번에 수집
+        scores = {
+            component: assessments[component]["overall_score"]
+            for component in weights
+            if assessments.get(component) and "overall_score" in assessments[component]
+        }
 
-        overall_score = weighted_sum / total_weight if total_weight > 0 else 0
+        if len(scores) == len(weights):
+            # 모든 컴포넌트가 있으면 가중치 합이 1이므로 바로 가중합
+            overall_score = sum(scores[component] * weight for component, weight in weights.items())
+        else:
+            total_weight = sum(weights[component] for component in scores)
+            weighted_sum = sum(score * weights[component] for component, score in scores.items())
+            overall_score = weighted_sum / total_weight if total_weight > 0 else 0
         self.assessment_report["overall_score"] = overall_score
 
     def _print_assessment_report(self):
@@ -352,7 +360,7 @@ class PipelineQualityAssessment:
         print(f"\n📋 컴포넌트별 점수:")
         assessments = self.assessment_report["assessments"]
         for component, data in assessments.items():
-            score = data.get("overall_score", 0)
+            score = (data or {}).get("overall_score", 0)
             component_name = {
                 "basic_processing": "기본 처리",
                 "template_system": "템플릿 시스템",
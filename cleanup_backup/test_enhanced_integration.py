@@ -165,14 +165,12 @@ async def test_enhanced_integration():
 
             # 핵심 필드 추출 검증
             core_fields = ['document_number', 'auto_code', 'effective_date', 'auto_date']
-            extracted_core = []
-
-            if result.template_match:
-                for core_field in core_fields:
-                    if core_field in result.template_match.matched_fields:
-                        value = result.template_match.matched_fields[core_field].get('value', '')
-                        if value.strip():
-                            extracted_core.append(f'{core_field}: {value}')
+            matched_fields = result.template_match.matched_fields if result.template_match else {}
+            extracted_core = [
+                f'{core_field}: {value}'
+                for core_field in core_fields
+                if (value := (matched_fields.get(core_field) or {}).get('value', '')).strip()
+            ]
 
             if extracted_core:
                 print('   📋 추출된 핵심 정보:')
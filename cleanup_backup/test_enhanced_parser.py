@@ -6,6 +6,7 @@ Enhanced Parser 테스트 스크립트
 import asyncio
 import json
 import sys
+from collections import Counter
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
@@ -57,16 +58,24 @@ async def test_enhanced_parser():
             print(f'🔍 RAG 청킹 결과:')
             print(f'   총 청크 수: {len(result.rag_chunks)}개')
 
-            chunk_types = {}
-            for chunk in result.rag_chunks:
-                chunk_type = chunk.chunk_type.value
-                chunk_types[chunk_type] = chunk_types.get(chunk_type, 0) + 1
+            chunk_types = dict(Counter(chunk.chunk_type.value for chunk in result.rag_chunks))
 
             for chunk_type, count in chunk_types.items():
                 print(f'   • {chunk_type}: {count}개')
             print()
 
-            # 샘플 청크 보기
+            # 샘플 청크 (저장용 레코드)
+            sample_chunks = [
+                {
+                    'id': chunk.chunk_id,
+                    'type': chunk.chunk_type.value,
+                    'text': chunk.text[:200],
+                    'keywords': chunk.relevance_keywords,
+                    'confidence': chunk.confidence
+                }
+                for chunk in result.rag_chunks[:5]
+            ]
+
             print('📝 샘플 청크:')
             for i, chunk in enumerate(result.rag_chunks[:3]):
                 print(f'   청크 {i+1} ({chunk.chunk_type.value}):')
@@ -99,16 +108,7 @@ async def test_enhanced_parser():
                     'chunk_types': chunk_types,
                     'vector_documents_count': len(result.vector_documents)
                 },
-                'sample_chunks': [
-                    {
-                        'id': chunk.chunk_id,
-                        'type': chunk.chunk_type.value,
-                        'text': chunk.text[:200],
-                        'keywords': chunk.relevance_keywords,
-                        'confidence': chunk.confidence
-                    }
-                    for chunk in result.rag_chunks[:5]
-                ]
+                'sample_chunks': sample_chunks
             }
 
             # final_output 디렉토리 생성
@@ -4,11 +4,22 @@
 import asyncio
 from src.parsers.unified_docx_parser import UnifiedDocxParser
 
-async def test_header_footer():
-    parser = UnifiedDocxParser()
-    parser.parsing_mode = 'enhanced'
+# 이벤트 루프 가속 (선택)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# 출력용 구분선
+_DASH40 = "-" * 40
 
-    result = await parser.parse("../기술기준_예시.docx")
+# 모듈 로드 시 한 번만 생성하여 반복 실행 시 재사용
+_PARSER = UnifiedDocxParser()
+_PARSER.parsing_mode = 'enhanced'
+
+async def test_header_footer():
+    result = await _PARSER.parse("../기술기준_예시.docx")
 
     if result.success:
         content = result.content
@@ -19,16 +30,18 @@ async def test_header_footer():
         headers_footers = xml_struct.get('headers_footers', {})
 
         print("🔍 헤더/푸터 추출 결과:")
-        print("-" * 40)
+        print(_DASH40)
 
         if headers_footers:
             print(f"✅ 헤더 수: {len(headers_footers.get('headers', []))}")
             for header in headers_footers.get('headers', []):
-                print(f"   헤더: {header.get('text', '')[:100]}...")
+                text = header.get('text', '')
+                print(f"   헤더: {text[:100]}{'...' if len(text) > 100 else ''}")
 
             print(f"✅ 푸터 수: {len(headers_footers.get('footers', []))}")
             for footer in headers_footers.get('footers', []):
-                print(f"   푸터: {footer.get('text', '')[:100]}...")
+                text = footer.get('text', '')
+                print(f"   푸터: {text[:100]}{'...' if len(text) > 100 else ''}")
         else:
             print("❌ 헤더/푸터를 찾을 수 없습니다")
 
@@ -41,4 +54,6 @@ async def test_header_footer():
             print(f"   개정번호: {doc_struct.get('revision')}")
 
 if __name__ == "__main__":
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(test_header_footer())
\ No newline at end of file
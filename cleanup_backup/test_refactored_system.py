@@ -5,6 +5,7 @@
 """
 
 import asyncio
+import functools
 import sys
 from pathlib import Path
 
@@ -12,20 +13,53 @@ from pathlib import Path
 from src.core.simplified_config import (
     ProcessingLevel, PipelineConfig,
     create_basic_config, create_standard_config,
-    SimplifiedConfigManager
+    SimplifiedConfigManager, migrate_legacy_config
 )
-from src.core.modernized_pipeline import ModernizedPipeline, quick_process
+from src.core.modernized_pipeline import ModernizedPipeline
+from src.parsers import DocumentParserFactory
 from src.parsers.unified_docx_parser import UnifiedDocxParser
 
+# 이벤트 루프 가속 (선택)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# 출력용 구분선
+_EQ50 = "=" * 50
+_EQ60 = "=" * 60
+
+
+# 테스트 간에 재사용하는 인스턴스들 (최초 호출 시 한 번만 생성)
+@functools.cache
+def _parser() -> UnifiedDocxParser:
+    return UnifiedDocxParser()
+
+
+@functools.cache
+def _config_manager() -> SimplifiedConfigManager:
+    return SimplifiedConfigManager()
+
+
+@functools.cache
+def _pipeline(output_dir: str) -> ModernizedPipeline:
+    return ModernizedPipeline(output_dir=output_dir, config_manager=_config_manager())
+
+
+@functools.cache
+def _parser_factory(use_legacy: bool) -> DocumentParserFactory:
+    return DocumentParserFactory(use_legacy=use_legacy)
+
 
 async def test_unified_parser():
     """통합 파서 테스트"""
-    print("=" * 50)
+    print(_EQ50)
     print("🔧 통합 파서 테스트")
-    print("=" * 50)
+    print(_EQ50)
 
     try:
-        parser = UnifiedDocxParser()
+        parser = _parser()
         print("✅ UnifiedDocxParser 초기화 성공")
 
         # 지원 형식 확인
@@ -43,13 +77,13 @@ async def test_unified_parser():
 
 async def test_simplified_config():
     """단순화된 설정 시스템 테스트"""
-    print("\n" + "=" * 50)
+    print("\n" + _EQ50)
     print("⚙️ 단순화된 설정 시스템 테스트")
-    print("=" * 50)
+    print(_EQ50)
 
     try:
         # 설정 관리자 초기화
-        config_manager = SimplifiedConfigManager()
+        config_manager = _config_manager()
         print("✅ SimplifiedConfigManager 초기화 성공")
 
         # 각 처리 레벨 테스트
@@ -79,13 +113,13 @@ async def test_simplified_config():
 
 async def test_modernized_pipeline():
     """현대화된 파이프라인 테스트"""
-    print("\n" + "=" * 50)
+    print("\n" + _EQ50)
     print("🏭 현대화된 파이프라인 테스트")
-    print("=" * 50)
+    print(_EQ50)
 
     try:
         # 파이프라인 초기화
-        pipeline = ModernizedPipeline(output_dir="test_refactor_output")
+        pipeline = _pipeline("test_refactor_output")
         print("✅ ModernizedPipeline 초기화 성공")
 
         # 설정 생성
@@ -108,9 +142,9 @@ async def test_modernized_pipeline():
 
 async def test_document_processing():
     """실제 문서 처리 테스트 (문서가 있는 경우)"""
-    print("\n" + "=" * 50)
+    print("\n" + _EQ50)
     print("📄 문서 처리 테스트")
-    print("=" * 50)
+    print(_EQ50)
 
     # 테스트 문서 경로들
     test_documents = [
@@ -118,11 +152,7 @@ async def test_document_processing():
         "기술기준_예시.docx"
     ]
 
-    document_path = None
-    for doc_path in test_documents:
-        if Path(doc_path).exists():
-            document_path = doc_path
-            break
+    document_path = next((doc_path for doc_path in test_documents if Path(doc_path).is_file()), None)
 
     if not document_path:
         print("⚠️ 테스트 문서를 찾을 수 없어 스킵합니다")
@@ -133,10 +163,9 @@ async def test_document_processing():
         print(f"📄 테스트 문서: {document_path}")
 
         # 간단한 처리 테스트
-        result = await quick_process(
+        result = await _pipeline("test_refactor_output").process_document(
             document_path,
-            ProcessingLevel.BASIC,
-            "test_refactor_output"
+            PipelineConfig(processing_level=ProcessingLevel.BASIC)
         )
 
         if result.success:
@@ -162,14 +191,12 @@ async def test_document_processing():
 
 async def test_legacy_compatibility():
     """레거시 호환성 테스트"""
-    print("\n" + "=" * 50)
+    print("\n" + _EQ50)
     print("🔄 레거시 호환성 테스트")
-    print("=" * 50)
+    print(_EQ50)
 
     try:
         # 레거시 설정 마이그레이션 테스트
-        from src.core.simplified_config import migrate_legacy_config
-
         legacy_config = {
             'processing_mode': 'enhanced',
             'template_confidence_threshold': 0.7,
@@ -182,15 +209,13 @@ async def test_legacy_compatibility():
         print(f"   임계값: {new_config.override_template_threshold}")
 
         # 레거시 파서 팩토리 테스트
-        from src.parsers import DocumentParserFactory
-
         # 새 방식
-        factory_new = DocumentParserFactory(use_legacy=False)
+        factory_new = _parser_factory(use_legacy=False)
         parser_new = factory_new.get_parser('test.docx')
         print(f"✅ 새 팩토리: {parser_new.__class__.__name__}")
 
         # 레거시 방식
-        factory_legacy = DocumentParserFactory(use_legacy=True)
+        factory_legacy = _parser_factory(use_legacy=True)
         parser_legacy = factory_legacy.get_parser('test.docx')
         print(f"✅ 레거시 팩토리: {parser_legacy.__class__.__name__}")
 
@@ -201,10 +226,19 @@ async def test_legacy_compatibility():
     return True
 
 
+async def _run_test(test_name, test_func):
+    """개별 테스트 실행 (예외는 실패로 기록하여 다른 테스트를 취소하지 않음)"""
+    try:
+        return await test_func()
+    except Exception as e:
+        print(f"❌ {test_name} 테스트 예외 발생: {e}")
+        return False
+
+
 async def main():
     """메인 테스트 실행"""
     print("🚀 리팩토링된 시스템 검증 테스트 시작")
-    print("=" * 60)
+    print(_EQ60)
 
     tests = [
         ("통합 파서", test_unified_parser),
@@ -214,20 +248,17 @@ async def main():
         ("레거시 호환성", test_legacy_compatibility)
     ]
 
-    results = []
+    # 독립적인 테스트들을 동시에 실행 (결과는 등록 순서대로 수집)
+    async with asyncio.TaskGroup() as tg:
+        tasks = [(test_name, tg.create_task(_run_test(test_name, test_func)))
+                 for test_name, test_func in tests]
 
-    for test_name, test_func in tests:
-        try:
-            result = await test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} 테스트 예외 발생: {e}")
-            results.append((test_name, False))
+    results = [(test_name, task.result()) for test_name, task in tasks]
 
     # 결과 요약
-    print("\n" + "=" * 60)
+    print("\n" + _EQ60)
     print("📊 테스트 결과 요약")
-    print("=" * 60)
+    print(_EQ60)
 
     passed = 0
     failed = 0
@@ -251,5 +282,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -10,6 +10,7 @@ from pathlib import Path
 import tempfile
 import json
 import time
+import importlib.util
 
 # 프로젝트 경로 추가
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
@@ -22,8 +23,25 @@ from src.core.docjson import DocJSONConverter
 from src.analyzers.layout_analyzer import LayoutAnalyzer
 from src.extractors.content_extractor import ContentExtractor
 
+# 이벤트 루프 가속 (선택)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# 출력용 구분선
+_EQ50 = "=" * 50
+
 print("🧪 Document Layout Analyzer - System Test")
-print("="*50)
+print(_EQ50)
+
+def _is_available(lib):
+    """라이브러리 설치 여부 확인 (모듈 코드는 실행하지 않음)"""
+    try:
+        return importlib.util.find_spec(lib) is not None
+    except (ImportError, ValueError):
+        return False
 
 def test_imports():
     """필수 라이브러리 임포트 테스트"""
@@ -45,20 +63,21 @@ def test_imports():
         ("torch", "PyTorch"),
     ]
 
+    # find_spec은 모듈을 실행하지 않으므로 torch 등의 초기화 비용이 없음
+    available = {lib: _is_available(lib) for lib, _ in required_libs + optional_libs}
+
     print("  필수 라이브러리:")
     for lib, name in required_libs:
-        try:
-            __import__(lib)
+        if available[lib]:
             print(f"  ✅ {name}")
-        except ImportError:
+        else:
             print(f"  ❌ {name} - 설치 필요")
 
     print("  선택적 라이브러리:")
     for lib, name in optional_libs:
-        try:
-            __import__(lib)
+        if available[lib]:
             print(f"  ✅ {name}")
-        except ImportError:
+        else:
             print(f"  ⚠️  {name} - 설치되지 않음 (기능 제한)")
 
 def test_config_system():
@@ -88,6 +107,7 @@ def test_device_manager():
 
         # 벤치마크 테스트
         print("  🏃 성능 벤치마크 (간단한 연산):")
+        # 디바이스끼리 CPU/메모리 대역폭을 두고 경쟁하지 않도록 한 번에 하나씩 측정
         for device in dm.devices[:2]:  # 최대 2개만 테스트
             if device.is_available:
                 device_name = f"{device.device_type.value}:{device.device_id}" if device.device_type.value != "cpu" else "cpu"
@@ -195,8 +215,8 @@ async def test_content_extractor():
     except Exception as e:
         print(f"  ❌ 콘텐츠 추출기 오류: {e}")
 
-def create_sample_docx():
-    """샘플 DOCX 파일 생성"""
+def create_sample_docx(target_dir: Path):
+    """샘플 DOCX 파일 생성 (target_dir에 한 번만 기록)"""
     try:
         from docx import Document
 
@@ -215,11 +235,11 @@ def create_sample_docx():
         doc.add_heading('2. 결론', level=1)
         doc.add_paragraph('테스트 문서 작성이 완료되었습니다.')
 
-        # 임시 파일로 저장
-        temp_file = tempfile.NamedTemporaryFile(suffix='.docx', delete=False)
-        doc.save(temp_file.name)
+        # 분석기가 파일 경로를 요구하므로 임시 디렉토리에 저장
+        sample_path = target_dir / 'sample.docx'
+        doc.save(str(sample_path))
 
-        return temp_file.name
+        return str(sample_path)
 
     except ImportError:
         print("  ⚠️  python-docx가 설치되지 않아 DOCX 샘플 생성을 건너뜁니다.")
@@ -232,12 +252,27 @@ async def test_full_pipeline():
     """전체 파이프라인 테스트"""
     print("\n8. 🔄 전체 파이프라인 테스트")
 
-    # 샘플 파일 생성
-    sample_file = create_sample_docx()
-    if not sample_file:
-        print("  ⚠️  샘플 파일 생성 실패, 파이프라인 테스트를 건너뜁니다.")
-        return
+    # 임시 디렉토리는 블록 종료 시 샘플 파일과 함께 정리됨
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sample_file = create_sample_docx(Path(temp_dir))
+        if not sample_file:
+            print("  ⚠️  샘플 파일 생성 실패, 파이프라인 테스트를 건너뜁니다.")
+            return
+
+        await _run_full_pipeline(sample_file)
+
+async def _process_many(analyzer, paths, output_dir: str, concurrency: int = 8):
+    """여러 문서를 동시 처리 (동시 실행 수는 concurrency로 제한)"""
+    semaphore = asyncio.Semaphore(concurrency)
 
+    async def _process_one(path):
+        async with semaphore:
+            return await analyzer.process_document(path, output_dir)
+
+    return await asyncio.gather(*map(_process_one, paths))
+
+async def _run_full_pipeline(sample_file: str):
+    """샘플 파일로 전체 파이프라인 실행"""
     try:
         print(f"  📄 샘플 파일 생성: {sample_file}")
 
@@ -255,16 +290,15 @@ async def test_full_pipeline():
         output_dir = Path("./test_output")
         output_dir.mkdir(exist_ok=True)
 
-        success = await analyzer.process_document(sample_file, str(output_dir))
+        output_file, = await _process_many(analyzer, [sample_file], str(output_dir))
 
         processing_time = time.time() - start_time
 
-        if success:
+        if output_file:
             print(f"  ✅ 파이프라인 테스트 성공!")
             print(f"  - 처리 시간: {processing_time:.2f}초")
 
-            # 결과 파일 확인
-            output_file = output_dir / (Path(sample_file).stem + ".docjson")
+            # 결과 파일 확인 (process_document가 반환한 저장 경로)
             if output_file.exists():
                 print(f"  📊 결과 파일 크기: {output_file.stat().st_size:,} bytes")
 
@@ -272,8 +306,9 @@ async def test_full_pipeline():
                 try:
                     with open(output_file, 'r', encoding='utf-8') as f:
                         result_data = json.load(f)
-                    print(f"  📄 생성된 섹션: {len(result_data.get('sections', []))}개")
-                    print(f"  📋 전체 블록: {sum(len(section.get('blocks', [])) for section in result_data.get('sections', []))}개")
+                    sections = result_data.get('sections', [])
+                    print(f"  📄 생성된 섹션: {len(sections)}개")
+                    print(f"  📋 전체 블록: {sum(len(section.get('blocks', [])) for section in sections)}개")
                 except Exception as e:
                     print(f"  ⚠️  결과 파일 검증 실패: {e}")
             else:
@@ -285,18 +320,11 @@ async def test_full_pipeline():
     except Exception as e:
         print(f"  ❌ 파이프라인 테스트 오류: {e}")
 
-    finally:
-        # 임시 파일 정리
-        try:
-            Path(sample_file).unlink(missing_ok=True)
-        except:
-            pass
-
 def print_summary():
     """테스트 요약 출력"""
-    print("\n" + "="*50)
+    print("\n" + _EQ50)
     print("📊 테스트 완료 요약")
-    print("="*50)
+    print(_EQ50)
     print("✅ 성공한 테스트는 정상 동작합니다.")
     print("❌ 실패한 테스트는 해당 기능에 문제가 있습니다.")
     print("⚠️  경고가 있는 테스트는 일부 기능이 제한됩니다.")
@@ -329,4 +357,6 @@ async def main():
         print(f"\n❌ 테스트 실행 중 오류: {e}")
 
 if __name__ == "__main__":
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file
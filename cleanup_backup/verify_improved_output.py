@@ -5,107 +5,170 @@
 
 import asyncio
 import json
+import os
 from pathlib import Path
+import aiofiles
 from datetime import datetime
 from src.parsers.unified_docx_parser import UnifiedDocxParser
 from src.core.modernized_pipeline import ModernizedPipeline
 from src.core.simplified_config import create_basic_config, create_standard_config, create_complete_config
 
-async def generate_improved_outputs():
-    """개선된 파서로 산출물 생성"""
+# 이벤트 루프 가속 (선택)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
-    print("=" * 80)
-    print("📊 개선된 파서 산출물 생성 및 검증")
-    print("=" * 80)
-    print(f"⏰ 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
+# 출력용 구분선
+_EQ80 = "=" * 80
+_DASH60 = "-" * 60
 
-    document_path = "../기술기준_예시.docx"
-    output_dir = Path("improved_output")
-    output_dir.mkdir(exist_ok=True)
+# 대용량 DocJSON 직렬화용 (선택)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+async def _write_json(path: Path, obj, pretty: bool = False):
+    """JSON 파일 비동기 저장 (pretty=True는 사람이 읽는 보고서에만 사용)"""
+    if pretty:
+        payload = json.dumps(obj, ensure_ascii=False, indent=2)
+    elif ORJSON_AVAILABLE:
+        payload = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    else:
+        payload = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+    async with aiofiles.open(path, 'w', encoding='utf-8') as f:
+        await f.write(payload)
 
-    # 1. 파서 직접 실행으로 상세 분석 결과 생성
-    print("1️⃣ 파서 직접 실행 - 상세 분석")
-    print("-" * 60)
 
+def _scan_entries(directory):
+    """디렉토리 항목을 이름순으로 한 번에 수집 (JSON 파일명, pipeline_* 하위 디렉토리명)"""
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    json_files = [e.name for e in entries if e.name.endswith('.json') and e.is_file()]
+    sub_dirs = [e.name for e in entries if e.name.startswith('pipeline_') and e.is_dir()]
+    return json_files, sub_dirs
+
+
+async def _run_parser(document_path: str, output_dir: Path):
+    """파서 직접 실행 및 상세 분석 결과 저장"""
     parser = UnifiedDocxParser()
     parser.parsing_mode = 'enhanced'  # XML 분석 포함
 
     result = await parser.parse(document_path)
+    doc_struct = {}
+    saved = []
 
     if result.success:
         content = result.content
 
-        # 원시 콘텐츠 저장
+        # 원시 콘텐츠 저장 (DocJSON은 dict로 변환)
         raw_output_path = output_dir / "01_raw_parsing_result.json"
-        with open(raw_output_path, 'w', encoding='utf-8') as f:
-            # DocJSON은 dict로 변환
-            output_content = {
-                'parsing_mode': content.get('parsing_mode', {}),
-                'document_structure': content.get('document_structure', {}),
-                'metadata': result.metadata
-            }
-            json.dump(output_content, f, ensure_ascii=False, indent=2)
-
-        print(f"✅ 원시 파싱 결과 저장: {raw_output_path}")
+        output_content = {
+            'parsing_mode': content.get('parsing_mode', {}),
+            'document_structure': content.get('document_structure', {}),
+            'metadata': result.metadata
+        }
+        await _write_json(raw_output_path, output_content)
+        saved.append(("원시 파싱 결과 저장", raw_output_path))
 
         # 문서 구조 분석 결과만 별도 저장
         doc_struct = content.get('document_structure', {})
         if doc_struct:
             struct_path = output_dir / "02_document_structure.json"
-            with open(struct_path, 'w', encoding='utf-8') as f:
-                json.dump(doc_struct, f, ensure_ascii=False, indent=2)
-            print(f"✅ 문서 구조 분석 저장: {struct_path}")
-
-            # 핵심 정보 출력
-            print("\n📋 감지된 핵심 정보:")
-            print(f"   - 문서번호: {doc_struct.get('document_number', 'None')}")
-            print(f"   - 제목: {doc_struct.get('title', 'None')[:50]}...")
-            print(f"   - 작성자: {doc_struct.get('author', 'None')}")
-            print(f"   - 시행일: {doc_struct.get('effective_date', 'None')}")
-            print(f"   - 개정번호: {doc_struct.get('revision', 'None')}")
-            print(f"   - 인식율: {doc_struct.get('recognition_score', 0):.1f}%")
+            await _write_json(struct_path, doc_struct)
+            saved.append(("문서 구조 분석 저장", struct_path))
 
         # DocJSON 저장
         if 'docjson' in content and content['docjson']:
             docjson_path = output_dir / "03_docjson_output.json"
-            with open(docjson_path, 'w', encoding='utf-8') as f:
-                json.dump(content['docjson'], f, ensure_ascii=False, indent=2)
-            print(f"✅ DocJSON 저장: {docjson_path}")
+            await _write_json(docjson_path, content['docjson'])
+            saved.append(("DocJSON 저장", docjson_path))
 
-    # 2. 파이프라인을 통한 전체 처리
-    print("\n2️⃣ 파이프라인 처리 - BASIC 레벨")
-    print("-" * 60)
+    return result, doc_struct, saved
 
-    pipeline = ModernizedPipeline(output_dir=str(output_dir / "pipeline_basic"))
-    basic_config = create_basic_config()
 
-    basic_result = await pipeline.process_document(document_path, basic_config)
+async def _run_pipeline(pipeline: ModernizedPipeline, document_path: str, config):
+    """지정한 설정으로 파이프라인 처리"""
+    return await pipeline.process_document(document_path, config)
 
-    if basic_result.success:
-        print(f"✅ BASIC 처리 성공")
-        print(f"   - 단계 완료: {basic_result.stages_completed}")
-        print(f"   - 품질 점수: {basic_result.quality_score:.1f}" if basic_result.quality_score else "   - 품질 점수: N/A")
-        print(f"   - 출력 파일: {basic_result.output_files}")
 
-    # 3. STANDARD 레벨 처리
-    print("\n3️⃣ 파이프라인 처리 - STANDARD 레벨")
-    print("-" * 60)
+def _print_pipeline_result(level: str, pipeline_result):
+    """파이프라인 처리 결과 출력"""
+    if pipeline_result.success:
+        print(f"✅ {level} 처리 성공")
+        print(f"   - 단계 완료: {pipeline_result.stages_completed}")
+        print(f"   - 품질 점수: {pipeline_result.quality_score:.1f}" if pipeline_result.quality_score else "   - 품질 점수: N/A")
+        print(f"   - 출력 파일: {pipeline_result.output_files}")
 
-    pipeline_std = ModernizedPipeline(output_dir=str(output_dir / "pipeline_standard"))
-    standard_config = create_standard_config()
 
-    std_result = await pipeline_std.process_document(document_path, standard_config)
+async def generate_improved_outputs():
+    """개선된 파서로 산출물 생성"""
 
-    if std_result.success:
-        print(f"✅ STANDARD 처리 성공")
-        print(f"   - 단계 완료: {std_result.stages_completed}")
-        print(f"   - 품질 점수: {std_result.quality_score:.1f}" if std_result.quality_score else "   - 품질 점수: N/A")
-        print(f"   - 출력 파일: {std_result.output_files}")
+    print(_EQ80)
+    print("📊 개선된 파서 산출물 생성 및 검증")
+    print(_EQ80)
+    print(f"⏰ 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print()
+
+    document_path = "../기술기준_예시.docx"
+    output_dir = Path("improved_output")
+    output_dir.mkdir(exist_ok=True)
+
+    # BASIC/STANDARD 처리는 하나의 파이프라인과 출력 디렉토리를 공유 (결과는 document_id로 구분)
+    pipeline_output_dir = output_dir / "pipeline_output"
+    pipeline = ModernizedPipeline(output_dir=str(pipeline_output_dir))
+
+    # 파서 직접 실행과 BASIC/STANDARD 파이프라인은 서로 독립적이므로 동시에 실행
+    (result, doc_struct, saved), basic_result, std_result = await asyncio.gather(
+        _run_parser(document_path, output_dir),
+        _run_pipeline(pipeline, document_path, create_basic_config()),
+        _run_pipeline(pipeline, document_path, create_standard_config())
+    )
+
+    # 문서 구조 필드는 보고서 전반에서 반복 사용하므로 한 번만 조회
+    doc_struct = doc_struct or {}
+    document_number = doc_struct.get('document_number')
+    title = doc_struct.get('title')
+    author = doc_struct.get('author')
+    effective_date = doc_struct.get('effective_date')
+    revision = doc_struct.get('revision')
+    recognition_score = doc_struct.get('recognition_score', 0)
+    section_count = len(doc_struct.get('sections', []))
+
+    # 1. 파서 직접 실행으로 상세 분석 결과 생성
+    print("1️⃣ 파서 직접 실행 - 상세 분석")
+    print(_DASH60)
+
+    for label, path in saved:
+        print(f"✅ {label}: {path}")
+
+    if doc_struct:
+        # 핵심 정보 출력
+        print("\n📋 감지된 핵심 정보:")
+        print(f"   - 문서번호: {document_number}")
+        title_text = title or 'None'
+        print(f"   - 제목: {title_text[:50]}{'...' if len(title_text) > 50 else ''}")
+        print(f"   - 작성자: {author}")
+        print(f"   - 시행일: {effective_date}")
+        print(f"   - 개정번호: {revision}")
+        print(f"   - 인식율: {recognition_score:.1f}%")
+
+    # 2. 파이프라인을 통한 전체 처리
+    print("\n2️⃣ 파이프라인 처리 - BASIC 레벨")
+    print(_DASH60)
+    _print_pipeline_result("BASIC", basic_result)
+
+    # 3. STANDARD 레벨 처리
+    print("\n3️⃣ 파이프라인 처리 - STANDARD 레벨")
+    print(_DASH60)
+    _print_pipeline_result("STANDARD", std_result)
 
     # 4. 비교 보고서 생성
     print("\n4️⃣ 비교 보고서 생성")
-    print("-" * 60)
+    print(_DASH60)
 
     comparison_report = {
         "timestamp": datetime.now().isoformat(),
@@ -125,24 +188,24 @@ async def generate_improved_outputs():
                 }
             },
             "after": {
-                "recognition_rate": f"{doc_struct.get('recognition_score', 0):.1f}%",
+                "recognition_rate": f"{recognition_score:.1f}%",
                 "detected_items": {
-                    "document_number": bool(doc_struct.get('document_number')),
-                    "title": bool(doc_struct.get('title')),
-                    "author": bool(doc_struct.get('author')),
-                    "effective_date": bool(doc_struct.get('effective_date')),
-                    "revision": bool(doc_struct.get('revision')),
-                    "sections": len(doc_struct.get('sections', [])) > 0,
+                    "document_number": bool(document_number),
+                    "title": bool(title),
+                    "author": bool(author),
+                    "effective_date": bool(effective_date),
+                    "revision": bool(revision),
+                    "sections": section_count > 0,
                     "tables": True,
                     "diagrams": True
                 },
                 "extracted_values": {
-                    "document_number": doc_struct.get('document_number'),
-                    "title": doc_struct.get('title'),
-                    "author": doc_struct.get('author'),
-                    "effective_date": doc_struct.get('effective_date'),
-                    "revision": doc_struct.get('revision'),
-                    "section_count": len(doc_struct.get('sections', [])),
+                    "document_number": document_number,
+                    "title": title,
+                    "author": author,
+                    "effective_date": effective_date,
+                    "revision": revision,
+                    "section_count": section_count,
                     "patterns_found": doc_struct.get('patterns_found', {})
                 }
             }
@@ -151,45 +214,49 @@ async def generate_improved_outputs():
             "raw_parsing": str(output_dir / "01_raw_parsing_result.json"),
             "document_structure": str(output_dir / "02_document_structure.json"),
             "docjson": str(output_dir / "03_docjson_output.json"),
-            "pipeline_basic": str(output_dir / "pipeline_basic"),
-            "pipeline_standard": str(output_dir / "pipeline_standard")
+            "pipeline_output": str(pipeline_output_dir),
+            "pipeline_basic_files": {k: str(v) for k, v in basic_result.output_files.items()},
+            "pipeline_standard_files": {k: str(v) for k, v in std_result.output_files.items()}
         }
     }
 
     report_path = output_dir / "00_comparison_report.json"
-    with open(report_path, 'w', encoding='utf-8') as f:
-        json.dump(comparison_report, f, ensure_ascii=False, indent=2)
+    await _write_json(report_path, comparison_report, pretty=True)
 
     print(f"✅ 비교 보고서 저장: {report_path}")
 
     # 5. 요약 출력
-    print("\n" + "=" * 80)
+    print("\n" + _EQ80)
     print("📊 산출물 생성 완료 요약")
-    print("=" * 80)
+    print(_EQ80)
 
     print("\n✨ 개선 성과:")
-    print(f"   - 인식율: 33.3% → {doc_struct.get('recognition_score', 0):.1f}%")
-    print(f"   - 문서번호 감지: ❌ → {'✅' if doc_struct.get('document_number') else '❌'}")
-    print(f"   - 작성자 감지: ❌ → {'✅' if doc_struct.get('author') else '❌'}")
-    print(f"   - 시행일 감지: ❌ → {'✅' if doc_struct.get('effective_date') else '❌'}")
-    print(f"   - 개정번호 감지: ❌ → {'✅' if doc_struct.get('revision') else '❌'}")
+    print(f"   - 인식율: 33.3% → {recognition_score:.1f}%")
+    print(f"   - 문서번호 감지: ❌ → {'✅' if document_number else '❌'}")
+    print(f"   - 작성자 감지: ❌ → {'✅' if author else '❌'}")
+    print(f"   - 시행일 감지: ❌ → {'✅' if effective_date else '❌'}")
+    print(f"   - 개정번호 감지: ❌ → {'✅' if revision else '❌'}")
 
     print("\n📁 생성된 산출물 위치:")
     print(f"   {output_dir}/")
-    for file in sorted(output_dir.glob("*.json")):
-        print(f"   ├── {file.name}")
-    for dir in sorted(output_dir.glob("pipeline_*")):
-        print(f"   ├── {dir.name}/")
-        for file in sorted(dir.glob("*.json"))[:3]:
-            print(f"   │   └── {file.name}")
+    json_files, pipeline_dirs = await asyncio.to_thread(_scan_entries, output_dir)
+    for name in json_files:
+        print(f"   ├── {name}")
+    for dir_name in pipeline_dirs:
+        print(f"   ├── {dir_name}/")
+        dir_files, _ = await asyncio.to_thread(_scan_entries, os.path.join(output_dir, dir_name))
+        for name in dir_files[:3]:
+            print(f"   │   └── {name}")
 
     print("\n💡 산출물 확인 방법:")
     print("   1. 00_comparison_report.json - 개선 전후 비교")
     print("   2. 02_document_structure.json - 감지된 모든 구조 정보")
     print("   3. 03_docjson_output.json - 최종 DocJSON 포맷 결과")
-    print("   4. pipeline_*/기술기준_예시.docjson - 파이프라인 처리 결과")
+    print("   4. pipeline_output/*.docjson - 파이프라인 처리 결과 (BASIC/STANDARD)")
 
     print(f"\n⏰ 완료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 if __name__ == "__main__":
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(generate_improved_outputs())
\ No newline at end of file
@@ -6,6 +6,7 @@
 """
 
 import asyncio
+import os
 import sys
 import time
 from pathlib import Path
@@ -14,40 +15,69 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from step1_document_registration import step1_register_document
+from step2_template_selection import step2_template_selection
+from step3_annotation import step3_annotation_creation
+from step4_template_save import step4_template_creation
+from step5_pattern_parsing import step5_final_parsing
+
+# 이벤트 루프 가속 (선택, Windows 제외)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+def _write_lines(lines):
+    """여러 줄을 한 번의 write로 출력"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def print_step_header(step_num: int, title: str):
     """단계별 헤더 출력"""
-    print("\n" + "="*80)
-    print(f"🔥 {step_num}단계: {title}")
-    print("="*80)
+    _write_lines([
+        "\n" + "="*80,
+        f"🔥 {step_num}단계: {title}",
+        "="*80
+    ])
 
 def print_step_completion(step_num: int, title: str, duration: float):
     """단계 완료 메시지"""
-    print(f"\n✅ {step_num}단계 완료: {title}")
-    print(f"⏱️ 소요 시간: {duration:.3f}초")
+    _write_lines([
+        f"\n✅ {step_num}단계 완료: {title}",
+        f"⏱️ 소요 시간: {duration:.3f}초"
+    ])
+
+def _count_entries(dir_path: str):
+    """디렉토리 항목 수 (디렉토리가 없으면 None)"""
+    try:
+        with os.scandir(dir_path) as it:
+            return sum(1 for _ in it)
+    except FileNotFoundError:
+        return None
 
 async def run_complete_workflow():
     """완전 워크플로우 실행"""
-    total_start = time.time()
-
-    print("🚀 문서 파싱 완전 워크플로우 시작")
-    print("=" * 80)
-    print("📋 실행 단계:")
-    print("   1️⃣ 문서 등재 및 기본 분석")
-    print("   2️⃣ 템플릿 선택 및 적용")
-    print("   3️⃣ Annotation 생성 및 편집")
-    print("   4️⃣ 템플릿 저장 및 관리")
-    print("   5️⃣ 패턴 인식 및 최종 파싱")
-    print("=" * 80)
+    total_start = time.perf_counter_ns()
+
+    _write_lines([
+        "🚀 문서 파싱 완전 워크플로우 시작",
+        "=" * 80,
+        "📋 실행 단계:",
+        "   1️⃣ 문서 등재 및 기본 분석",
+        "   2️⃣ 템플릿 선택 및 적용",
+        "   3️⃣ Annotation 생성 및 편집",
+        "   4️⃣ 템플릿 저장 및 관리",
+        "   5️⃣ 패턴 인식 및 최종 파싱",
+        "=" * 80
+    ])
 
     # 1단계: 문서 등재
     print_step_header(1, "문서 등재 및 기본 분석")
-    step1_start = time.time()
+    step1_start = time.perf_counter_ns()
 
-    # step1_document_registration.py 내용을 직접 실행
-    from step1_document_registration import step1_register_document
     document_info = await step1_register_document()
 
-    step1_duration = time.time() - step1_start
+    step1_duration = (time.perf_counter_ns() - step1_start) / 1e9
     if document_info:
         print_step_completion(1, "문서 등재", step1_duration)
     else:
@@ -56,12 +86,11 @@ async def run_complete_workflow():
 
     # 2단계: 템플릿 선택
     print_step_header(2, "템플릿 선택 및 적용")
-    step2_start = time.time()
+    step2_start = time.perf_counter_ns()
 
-    from step2_template_selection import step2_template_selection
     template_info = await step2_template_selection()
 
-    step2_duration = time.time() - step2_start
+    step2_duration = (time.perf_counter_ns() - step2_start) / 1e9
     if template_info:
         print_step_completion(2, "템플릿 선택", step2_duration)
     else:
@@ -70,12 +99,11 @@ async def run_complete_workflow():
 
     # 3단계: Annotation
     print_step_header(3, "Annotation 생성 및 편집")
-    step3_start = time.time()
+    step3_start = time.perf_counter_ns()
 
-    from step3_annotation import step3_annotation_creation
     annotation_info = await step3_annotation_creation()
 
-    step3_duration = time.time() - step3_start
+    step3_duration = (time.perf_counter_ns() - step3_start) / 1e9
     if annotation_info:
         print_step_completion(3, "Annotation 생성", step3_duration)
     else:
@@ -84,12 +112,11 @@ async def run_complete_workflow():
 
     # 4단계: 템플릿 저장
     print_step_header(4, "템플릿 저장 및 관리")
-    step4_start = time.time()
+    step4_start = time.perf_counter_ns()
 
-    from step4_template_save import step4_template_creation
     template_save_info = await step4_template_creation()
 
-    step4_duration = time.time() - step4_start
+    step4_duration = (time.perf_counter_ns() - step4_start) / 1e9
     if template_save_info:
         print_step_completion(4, "템플릿 저장", step4_duration)
     else:
@@ -98,12 +125,11 @@ async def run_complete_workflow():
 
     # 5단계: 최종 파싱
     print_step_header(5, "패턴 인식 및 최종 파싱")
-    step5_start = time.time()
+    step5_start = time.perf_counter_ns()
 
-    from step5_pattern_parsing import step5_final_parsing
     final_info = await step5_final_parsing()
 
-    step5_duration = time.time() - step5_start
+    step5_duration = (time.perf_counter_ns() - step5_start) / 1e9
     if final_info:
         print_step_completion(5, "최종 파싱", step5_duration)
     else:
@@ -111,37 +137,39 @@ async def run_complete_workflow():
         return False
 
     # 전체 결과 요약
-    total_duration = time.time() - total_start
-
-    print("\n" + "🎉" * 25)
-    print("🏆 전체 워크플로우 성공적 완료!")
-    print("🎉" * 25)
-    print()
-
-    print("📊 최종 결과 요약:")
-    print(f"   ⏱️ 전체 소요 시간: {total_duration:.3f}초")
-    print(f"   📋 단계별 소요 시간:")
-    print(f"      1단계 (문서 등재): {step1_duration:.3f}초")
-    print(f"      2단계 (템플릿 선택): {step2_duration:.3f}초")
-    print(f"      3단계 (Annotation): {step3_duration:.3f}초")
-    print(f"      4단계 (템플릿 저장): {step4_duration:.3f}초")
-    print(f"      5단계 (최종 파싱): {step5_duration:.3f}초")
-    print()
+    total_duration = (time.perf_counter_ns() - total_start) / 1e9
+
+    # 요약은 버퍼에 모아 한 번에 출력
+    buf = [
+        "\n" + "🎉" * 25,
+        "🏆 전체 워크플로우 성공적 완료!",
+        "🎉" * 25,
+        "",
+        "📊 최종 결과 요약:",
+        f"   ⏱️ 전체 소요 시간: {total_duration:.3f}초",
+        f"   📋 단계별 소요 시간:",
+        f"      1단계 (문서 등재): {step1_duration:.3f}초",
+        f"      2단계 (템플릿 선택): {step2_duration:.3f}초",
+        f"      3단계 (Annotation): {step3_duration:.3f}초",
+        f"      4단계 (템플릿 저장): {step4_duration:.3f}초",
+        f"      5단계 (최종 파싱): {step5_duration:.3f}초",
+        "",
+        "🎯 달성된 성과:"
+    ]
 
-    print("🎯 달성된 성과:")
     if final_info:
-        print(f"   📈 템플릿 매칭 신뢰도: {final_info['template_confidence']:.1%}")
-        print(f"   📊 추출된 필드 수: {final_info['extracted_fields']}개")
-        print(f"   ⚡ 최종 처리 속도: {final_info['processing_time']:.3f}초")
+        buf.append(f"   📈 템플릿 매칭 신뢰도: {final_info['template_confidence']:.1%}")
+        buf.append(f"   📊 추출된 필드 수: {final_info['extracted_fields']}개")
+        buf.append(f"   ⚡ 최종 처리 속도: {final_info['processing_time']:.3f}초")
 
     if template_save_info:
-        print(f"   💾 생성된 템플릿 필드: {template_save_info['fields_count']}개")
+        buf.append(f"   💾 생성된 템플릿 필드: {template_save_info['fields_count']}개")
 
     if annotation_info:
-        print(f"   📝 자동 생성 annotation: {annotation_info['fields_count']}개 필드")
+        buf.append(f"   📝 자동 생성 annotation: {annotation_info['fields_count']}개 필드")
 
-    print()
-    print("📁 생성된 출력 디렉토리:")
+    buf.append("")
+    buf.append("📁 생성된 출력 디렉토리:")
     output_dirs = [
         "step1_analysis",
         "step2_template_test",
@@ -150,19 +178,22 @@ async def run_complete_workflow():
         "step5_final_parsing"
     ]
 
-    for output_dir in output_dirs:
-        dir_path = Path(output_dir)
-        if dir_path.exists():
-            file_count = len(list(dir_path.glob("*")))
-            print(f"   📂 {output_dir}: {file_count}개 파일")
+    # 디렉토리별 항목 수는 스레드에서 동시에 집계
+    file_counts = await asyncio.gather(
+        *(asyncio.to_thread(_count_entries, output_dir) for output_dir in output_dirs)
+    )
+    for output_dir, file_count in zip(output_dirs, file_counts):
+        if file_count is not None:
+            buf.append(f"   📂 {output_dir}: {file_count}개 파일")
 
-    print()
-    print("🔥 시스템 사용 준비 완료!")
-    print("💡 이제 다른 문서들도 동일한 과정으로 처리할 수 있습니다.")
+    buf.append("")
+    buf.append("🔥 시스템 사용 준비 완료!")
+    buf.append("💡 이제 다른 문서들도 동일한 과정으로 처리할 수 있습니다.")
+    _write_lines(buf)
 
     return True
 
-async def demonstrate_next_steps():
+def demonstrate_next_steps():
     """다음 단계 안내"""
     print("\n" + "🔮" * 25)
     print("🚀 다음 단계 가이드")
@@ -203,12 +234,15 @@ if __name__ == "__main__":
     print("📋 모든 단계를 순차적으로 실행합니다...")
     print()
 
+    if UVLOOP_AVAILABLE and not sys.platform.startswith('win'):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     # 워크플로우 실행
     success = asyncio.run(run_complete_workflow())
 
     if success:
         # 다음 단계 안내
-        asyncio.run(demonstrate_next_steps())
+        demonstrate_next_steps()
     else:
         print("\n❌ 워크플로우 실행 중 오류가 발생했습니다.")
         print("💡 각 단계별 스크립트를 개별적으로 실행하여 문제를 확인하세요.")
\ No newline at end of file
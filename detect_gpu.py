@@ -4,30 +4,135 @@
 GPU Detection Utility - 크로스 플랫폼 GPU 감지 및 설정
 """
 
+import ctypes
+import functools
 import subprocess
 import sys
 import platform
+import re
+import shutil
 import json
+import os
+import time
 from pathlib import Path
 
+# nvidia-smi 헤더의 CUDA 버전 (예: "CUDA Version: 12.2")
+_CUDA_VERSION_RE = re.compile(rb'CUDA Version:\s*([\d.]+)')
+
+# 빠른 JSON 파싱 (선택 - 설치 전에도 실행되므로 없으면 표준 json 사용)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# NVIDIA 관리 라이브러리 바인딩 (선택 - 있으면 nvidia-smi 실행 없이 조회)
+try:
+    import pynvml
+    PYNVML_AVAILABLE = True
+except ImportError:
+    PYNVML_AVAILABLE = False
+
+# GPU 설정 캐시 (유효 기간 7일)
+CONFIG_PATH = Path('config') / 'gpu_config.json'
+CONFIG_TTL = 7 * 86400
+
+# 외부 진단 도구 호출 제한 시간 (드라이버 응답 없음으로 멈추지 않도록)
+_PROBE_TIMEOUT = 2.0
+
+# 시스템 식별 정보 (모듈 로드 시 uname 한 번으로 수집)
+# POSIX는 os.uname() 단일 호출, Windows는 platform.uname()으로 대체
+# processor는 platform.processor()가 'uname -p'를 실행하므로 POSIX에서는 machine 값 사용
+if hasattr(os, 'uname'):
+    _uname = os.uname()
+    _SYSTEM, _NODE, _RELEASE, _VERSION, _MACHINE = (
+        _uname.sysname, _uname.nodename, _uname.release, _uname.version, _uname.machine
+    )
+    _PROCESSOR = _MACHINE
+else:
+    _uname = platform.uname()
+    _SYSTEM, _NODE, _RELEASE, _VERSION, _MACHINE = (
+        _uname.system, _uname.node, _uname.release, _uname.version, _uname.machine
+    )
+    _PROCESSOR = _uname.processor
+
+
+def _cuda_driver_version():
+    """CUDA 드라이버 API로 지원 CUDA 버전 조회 (nvidia-smi 추가 실행 없이)"""
+    lib_name = 'nvcuda.dll' if sys.platform == 'win32' else 'libcuda.so.1'
+    try:
+        libcuda = ctypes.CDLL(lib_name)
+        version = ctypes.c_int()
+        if libcuda.cuDriverGetVersion(ctypes.byref(version)) != 0:
+            return None
+    except (OSError, AttributeError):
+        return None
+
+    return f"{version.value // 1000}.{(version.value % 1000) // 10}"
+
+
+def _detect_nvidia_nvml():
+    """NVML 라이브러리로 NVIDIA GPU 조회 (pynvml 없거나 실패하면 None)"""
+    if not PYNVML_AVAILABLE:
+        return None
+
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError:
+        return None
 
+    try:
+        if pynvml.nvmlDeviceGetCount() == 0:
+            return None
+
+        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        name = pynvml.nvmlDeviceGetName(handle)
+        driver = pynvml.nvmlSystemGetDriverVersion()
+        cc_major, cc_minor = pynvml.nvmlDeviceGetCudaComputeCapability(handle)
+        cuda_driver = pynvml.nvmlSystemGetCudaDriverVersion()
+
+        # nvidia-smi CSV 출력과 같은 형식으로 맞춤
+        return {
+            'type': 'nvidia',
+            'name': name.decode() if isinstance(name, bytes) else name,
+            'memory': f"{pynvml.nvmlDeviceGetMemoryInfo(handle).total // (1024 * 1024)} MiB",
+            'driver': driver.decode() if isinstance(driver, bytes) else driver,
+            'compute_capability': f"{cc_major}.{cc_minor}",
+            'cuda_version': f"{cuda_driver // 1000}.{(cuda_driver % 1000) // 10}",
+            'available': True
+        }
+    except pynvml.NVMLError:
+        return None
+    finally:
+        pynvml.nvmlShutdown()
+
+
+@functools.lru_cache(maxsize=1)
 def detect_nvidia_gpu():
-    """NVIDIA GPU 감지"""
+    """NVIDIA GPU 감지 (NVML 라이브러리 우선, 없으면 nvidia-smi)"""
+    gpu = _detect_nvidia_nvml()
+    if gpu is not None:
+        return gpu
+
+    if not shutil.which('nvidia-smi'):
+        return None
+
     try:
         result = subprocess.run(['nvidia-smi', '--query-gpu=name,memory.total,driver_version,compute_cap',
                                '--format=csv,noheader'],
-                              capture_output=True, text=True, check=True)
+                              capture_output=True, text=True, check=True, timeout=_PROBE_TIMEOUT)
 
         if result.stdout.strip():
             gpu_info = result.stdout.strip().split('\n')[0].split(', ')
 
-            # CUDA 버전 감지
-            cuda_result = subprocess.run(['nvidia-smi'], capture_output=True, text=True)
-            cuda_version = "unknown"
-            for line in cuda_result.stdout.split('\n'):
-                if 'CUDA Version' in line:
-                    cuda_version = line.split('CUDA Version:')[1].split('|')[0].strip()
-                    break
+            # CUDA 버전 감지 (드라이버 라이브러리 조회 실패 시에만 nvidia-smi 출력 파싱)
+            cuda_version = _cuda_driver_version()
+            if cuda_version is None:
+                # 로케일 디코딩 없이 바이트 출력에서 ASCII 버전 문자열만 추출
+                cuda_result = subprocess.run(['nvidia-smi'], capture_output=True,
+                                             timeout=_PROBE_TIMEOUT)
+                match = _CUDA_VERSION_RE.search(cuda_result.stdout)
+                cuda_version = match.group(1).decode('ascii') if match else "unknown"
 
             return {
                 'type': 'nvidia',
@@ -38,59 +143,95 @@ def detect_nvidia_gpu():
                 'cuda_version': cuda_version,
                 'available': True
             }
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
         pass
 
     return None
 
 
+def _detect_amd_hip():
+    """HIP 런타임 라이브러리로 AMD GPU 조회 (라이브러리가 없으면 None)"""
+    lib_name = 'amdhip64.dll' if sys.platform == 'win32' else 'libamdhip64.so'
+    try:
+        libhip = ctypes.CDLL(lib_name)
+        count = ctypes.c_int()
+        if libhip.hipGetDeviceCount(ctypes.byref(count)) != 0 or count.value == 0:
+            return None
+        name = ctypes.create_string_buffer(256)
+        if libhip.hipDeviceGetName(name, len(name), 0) != 0:
+            return None
+    except (OSError, AttributeError):
+        return None
+
+    return {
+        'type': 'amd',
+        'name': name.value.decode('utf-8', errors='replace'),
+        'available': True,
+        'rocm': True
+    }
+
+
+@functools.lru_cache(maxsize=1)
 def detect_amd_gpu():
-    """AMD GPU 감지 (ROCm)"""
+    """AMD GPU 감지 (ROCm, HIP 라이브러리 우선, 없으면 rocm-smi)"""
+    gpu = _detect_amd_hip()
+    if gpu is not None:
+        return gpu
+
+    if not shutil.which('rocm-smi'):
+        return None
+
     try:
         # ROCm 감지
         result = subprocess.run(['rocm-smi', '--showproductname'],
-                              capture_output=True, text=True, check=True)
-        if result.stdout.strip():
+                              capture_output=True, check=True, timeout=_PROBE_TIMEOUT)
+        product_name = result.stdout.strip()
+        if product_name:
             return {
                 'type': 'amd',
-                'name': result.stdout.strip(),
+                'name': product_name.decode('utf-8', errors='replace'),
                 'available': True,
                 'rocm': True
             }
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
         pass
 
     return None
 
 
-def detect_apple_silicon():
-    """Apple Silicon 감지"""
-    if platform.system() == 'Darwin' and platform.processor() == 'arm':
-        try:
-            result = subprocess.run(['sysctl', '-n', 'machdep.cpu.brand_string'],
-                                  capture_output=True, text=True)
-            if 'Apple' in result.stdout:
-                return {
-                    'type': 'apple',
-                    'name': result.stdout.strip(),
-                    'available': True,
-                    'mps': True
-                }
-        except:
-            pass
+def _sysctl_string(name):
+    """macOS sysctl 문자열 값 조회 (subprocess 없이 libc sysctlbyname 사용)"""
+    try:
+        libc = ctypes.CDLL(None)
+        size = ctypes.c_size_t()
+        if libc.sysctlbyname(name.encode(), None, ctypes.byref(size), None, 0) != 0:
+            return None
+        buf = ctypes.create_string_buffer(size.value)
+        if libc.sysctlbyname(name.encode(), buf, ctypes.byref(size), None, 0) != 0:
+            return None
+    except (OSError, AttributeError):
+        return None
 
-    return None
+    return buf.value.decode('utf-8', errors='replace').strip()
 
 
-def get_cuda_version_for_pytorch():
-    """PyTorch용 CUDA 버전 결정"""
-    gpu_info = detect_nvidia_gpu()
+@functools.lru_cache(maxsize=1)
+def detect_apple_silicon():
+    """Apple Silicon 감지"""
+    if _SYSTEM == 'Darwin' and _MACHINE == 'arm64':
+        brand = _sysctl_string('machdep.cpu.brand_string') or ''
+        return {
+            'type': 'apple',
+            'name': brand if 'Apple' in brand else 'Apple Silicon',
+            'available': True,
+            'mps': True
+        }
 
-    if not gpu_info:
-        return None
+    return None
 
-    cuda_version = gpu_info.get('cuda_version', 'unknown')
 
+def _pytorch_cuda_tag(cuda_version):
+    """CUDA 버전 문자열을 PyTorch 인덱스 태그로 변환"""
     # CUDA 버전에 따른 PyTorch 인덱스 URL 매핑
     if cuda_version != 'unknown':
         try:
@@ -113,15 +254,27 @@ def get_cuda_version_for_pytorch():
     return 'cu118'  # 기본값
 
 
+@functools.lru_cache(maxsize=1)
+def get_cuda_version_for_pytorch():
+    """PyTorch용 CUDA 버전 결정"""
+    gpu_info = detect_nvidia_gpu()
+
+    if not gpu_info:
+        return None
+
+    return _pytorch_cuda_tag(gpu_info.get('cuda_version', 'unknown'))
+
+
 def get_system_info():
     """시스템 정보 수집"""
     info = {
-        'platform': platform.system(),
-        'platform_release': platform.release(),
-        'platform_version': platform.version(),
-        'architecture': platform.machine(),
-        'processor': platform.processor(),
+        'platform': _SYSTEM,
+        'platform_release': _RELEASE,
+        'platform_version': _VERSION,
+        'architecture': _MACHINE,
+        'processor': _PROCESSOR,
         'python_version': sys.version,
+        'fingerprint': _hardware_fingerprint(),
         'gpu': None,
         'recommended_packages': {}
     }
@@ -171,7 +324,8 @@ def generate_install_commands(info):
         gpu_type = info['gpu']['type']
 
         if gpu_type == 'nvidia':
-            cuda_version = get_cuda_version_for_pytorch()
+            # 캐시된 설정에서도 재감지 없이 동작하도록 info의 CUDA 버전 사용
+            cuda_version = _pytorch_cuda_tag(info['gpu'].get('cuda_version', 'unknown'))
             commands.append(f"# NVIDIA GPU 감지됨 - CUDA {info['gpu'].get('cuda_version', 'unknown')}")
             commands.append(f"pip install torch torchvision --index-url https://download.pytorch.org/whl/{cuda_version}")
             commands.append("pip install paddlepaddle-gpu==2.5.2")
@@ -197,12 +351,36 @@ def generate_install_commands(info):
     return commands
 
 
+def _hardware_fingerprint():
+    """설정 캐시 무효화용 하드웨어 식별자"""
+    return f"{_NODE}/{_MACHINE}"
+
+
+def load_cached_config():
+    """최근에 저장된 같은 하드웨어의 GPU 설정이 있으면 반환"""
+    try:
+        if time.time() - os.stat(CONFIG_PATH).st_mtime >= CONFIG_TTL:
+            return None
+        if ORJSON_AVAILABLE:
+            info = orjson.loads(CONFIG_PATH.read_bytes())
+        else:
+            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+                info = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if info.get('fingerprint') != _hardware_fingerprint():
+        return None
+
+    return info
+
+
 def save_config(info):
     """GPU 설정 저장"""
-    config_path = Path('config') / 'gpu_config.json'
+    config_path = CONFIG_PATH
     config_path.parent.mkdir(exist_ok=True)
 
-    with open(config_path, 'w', encoding='utf-8') as f:
+    with open(config_path, 'w', buffering=65536, encoding='utf-8') as f:
         json.dump(info, f, indent=2, ensure_ascii=False)
 
     print(f"GPU 설정이 {config_path}에 저장되었습니다.")
@@ -214,7 +392,11 @@ def main():
     print("GPU 감지 유틸리티")
     print("="*60)
 
-    info = get_system_info()
+    # 최근 감지 결과가 있으면 재감지 생략 (--refresh로 강제 재감지)
+    info = None if '--refresh' in sys.argv[1:] else load_cached_config()
+    from_cache = info is not None
+    if not from_cache:
+        info = get_system_info()
 
     print(f"\n시스템: {info['platform']} {info['architecture']}")
     print(f"Python: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
@@ -239,23 +421,23 @@ def main():
         print(cmd)
 
     # 설정 저장
-    save_config(info)
+    if from_cache:
+        print(f"\n캐시된 GPU 설정 사용: {CONFIG_PATH} (재감지: --refresh)")
+    else:
+        save_config(info)
 
     # 설치 스크립트 생성 여부 확인
-    if len(sys.argv) > 1 and sys.argv[1] == '--generate-script':
+    if '--generate-script' in sys.argv[1:]:
         script_name = 'install_gpu.bat' if info['platform'] == 'Windows' else 'install_gpu.sh'
 
-        with open(script_name, 'w') as f:
-            if info['platform'] == 'Windows':
-                f.write("@echo off\n")
-                f.write("REM GPU 자동 감지 설치 스크립트\n\n")
-            else:
-                f.write("#!/bin/bash\n")
-                f.write("# GPU 자동 감지 설치 스크립트\n\n")
+        if info['platform'] == 'Windows':
+            header = "@echo off\nREM GPU 자동 감지 설치 스크립트\n\n"
+        else:
+            header = "#!/bin/bash\n# GPU 자동 감지 설치 스크립트\n\n"
+        body = "\n".join(cmd for cmd in commands if not cmd.startswith('#'))
 
-            for cmd in commands:
-                if not cmd.startswith('#'):
-                    f.write(cmd + '\n')
+        # 스크립트 전체를 한 번에 기록 (기존과 같이 시스템 기본 인코딩 사용)
+        Path(script_name).write_text(header + body + "\n")
 
         print(f"\n설치 스크립트 '{script_name}'이 생성되었습니다.")
 
@@ -4,21 +4,36 @@ Enhanced Main - 고급 DOCX 문서 처리 메인 스크립트
 기술기준 문서의 완전한 분석 및 벡터화 처리
 """
 
+from __future__ import annotations
+
 import asyncio
 import argparse
+import fnmatch
 import logging
+import os
 import sys
+from glob import glob
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional
+
+# 프로젝트 모듈 임포트 (파이프라인 모듈은 딥러닝 프레임워크를 함께 로드하므로
+# --help 등에서 비용이 들지 않도록 실제로 필요할 때 임포트)
+if TYPE_CHECKING:
+    from src.core.enhanced_modernized_pipeline import EnhancedModernizedPipeline
+    from src.core.simplified_config import PipelineConfig
 
-# 프로젝트 모듈 임포트
-from src.core.enhanced_modernized_pipeline import EnhancedModernizedPipeline
-from src.core.simplified_config import PipelineConfig, ProcessingLevel
+# 이벤트 루프 가속 (선택, Windows 제외)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 
 def setup_logging(verbose: bool = False):
     """로깅 설정"""
     log_level = logging.DEBUG if verbose else logging.INFO
+
     logging.basicConfig(
         level=log_level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -68,11 +83,28 @@ async def process_single_document(pipeline: EnhancedModernizedPipeline,
 
 async def process_batch_documents(pipeline: IntegratedPipeline,
                                  file_paths: List[Path],
-                                 config: PipelineConfig) -> None:
-    """배치 문서 처리"""
-    print(f"\n📚 배치 처리 시작: {len(file_paths)}개 문서")
+                                 config: PipelineConfig,
+                                 concurrency: int = 1) -> None:
+    """배치 문서 처리 (제한된 큐 + 워커 태스크, 완료되는 대로 결과 출력)"""
+    print(f"\n📚 배치 처리 시작: {len(file_paths)}개 문서 (동시 처리: {concurrency})")
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    results = []
+
+    async def producer():
+        for file_path in file_paths:
+            await queue.put(file_path)
+        for _ in range(concurrency):
+            await queue.put(None)  # 워커 종료 신호
 
-    results = await pipeline.batch_process_documents(file_paths, config)
+    async def worker():
+        while (file_path := await queue.get()) is not None:
+            result = await pipeline.process_document(file_path, config)
+            results.append(result)
+            status = "✅" if result.success else "❌"
+            print(f"   {status} [{len(results)}/{len(file_paths)}] {file_path}")
+
+    await asyncio.gather(producer(), *(worker() for _ in range(concurrency)))
 
     success_count = sum(1 for r in results if r.success)
     print(f"\n📊 배치 처리 결과:")
@@ -135,8 +167,43 @@ async def show_statistics(pipeline: IntegratedPipeline) -> None:
             print(f"   {doc_type}: {count}개")
 
 
+def is_glob_pattern(file_pattern: str) -> bool:
+    """글롭 패턴 여부"""
+    return '*' in file_pattern or '?' in file_pattern
+
+
+def scan_glob(file_pattern: str) -> Iterator[Path]:
+    """글롭 패턴에 맞는 파일을 os.scandir로 탐색 (DirEntry 캐시를 사용해 추가 stat 없음)"""
+    directory, name_pattern = os.path.split(file_pattern)
+    if is_glob_pattern(directory):
+        # 디렉토리 부분에도 와일드카드가 있으면 glob에 위임
+        yield from map(Path, glob(file_pattern))
+        return
+
+    include_hidden = name_pattern.startswith('.')
+    try:
+        with os.scandir(directory or os.curdir) as entries:
+            for entry in entries:
+                if not include_hidden and entry.name.startswith('.'):
+                    continue
+                if fnmatch.fnmatchcase(entry.name, name_pattern) and entry.is_file():
+                    yield Path(entry.path) if directory else Path(entry.name)
+    except OSError:
+        return
+
+
+def resolve_file_pattern(file_pattern: str) -> List[Path]:
+    """파일 인수 하나를 존재하는 파일 경로 목록으로 변환 (블로킹, 글롭 패턴 지원)"""
+    if is_glob_pattern(file_pattern):
+        return list(scan_glob(file_pattern))
+
+    return [Path(file_pattern)] if os.path.isfile(file_pattern) else []
+
+
 def create_pipeline_config(args) -> PipelineConfig:
     """명령행 인수로부터 파이프라인 설정 생성"""
+    from src.core.simplified_config import PipelineConfig
+
     # 처리 모드 결정
     if args.vectorize:
         mode = ProcessingMode.VECTORIZE
@@ -221,6 +288,8 @@ async def main():
     # 출력 및 기타
     parser.add_argument('--output', '-o', help='출력 디렉토리')
     parser.add_argument('--verbose', '-v', action='store_true', help='상세 로그 출력')
+    parser.add_argument('--concurrency', type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help='배치 처리 동시 문서 수 (기본: CPU 코어 수의 절반)')
 
     # 특수 명령
     parser.add_argument('--create-template', action='store_true', help='대화형 템플릿 생성')
@@ -263,26 +332,23 @@ async def main():
             parser.print_help()
             return
 
-        # 파일 경로 준비
+        # 파일 경로 준비 (디렉토리 탐색은 이벤트 루프를 막지 않도록 스레드에서 동시 수행)
+        resolved = await asyncio.gather(
+            *(asyncio.to_thread(resolve_file_pattern, file_pattern) for file_pattern in args.files)
+        )
+
         file_paths = []
-        for file_pattern in args.files:
-            if '*' in file_pattern or '?' in file_pattern:
-                # 글롭 패턴 처리
-                from glob import glob
-                matched_files = glob(file_pattern)
-                file_paths.extend([Path(f) for f in matched_files])
-            else:
-                file_path = Path(file_pattern)
-                if file_path.exists():
-                    file_paths.append(file_path)
-                else:
-                    print(f"⚠️  파일을 찾을 수 없습니다: {file_path}")
+        for file_pattern, matched_files in zip(args.files, resolved):
+            if matched_files:
+                file_paths.extend(matched_files)
+            elif not is_glob_pattern(file_pattern):
+                print(f"⚠️  파일을 찾을 수 없습니다: {file_pattern}")
 
         if not file_paths:
             print("❌ 처리할 유효한 파일이 없습니다.")
             return
 
-        # 파이프라인 설정 생성
+        # 파이프라인 설정 생성 (불변 객체 하나를 모든 문서 처리에서 공유)
         config = create_pipeline_config(args)
 
         # 문서 처리
@@ -290,7 +356,7 @@ async def main():
             success = await process_single_document(pipeline, file_paths[0], config)
             sys.exit(0 if success else 1)
         else:
-            await process_batch_documents(pipeline, file_paths, config)
+            await process_batch_documents(pipeline, file_paths, config, max(1, args.concurrency))
 
     except KeyboardInterrupt:
         print("\n⏹️  사용자에 의해 중단되었습니다.")
@@ -309,5 +375,7 @@ if __name__ == "__main__":
     # Windows에서 asyncio 이벤트 루프 정책 설정
     if sys.platform.startswith('win'):
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    elif UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     asyncio.run(main())
\ No newline at end of file
@@ -5,28 +5,51 @@ Cross-Platform Auto Installer with GPU Detection
 자동으로 시스템을 감지하고 적절한 패키지를 설치합니다.
 """
 
+import functools
+import hashlib
+import json
 import subprocess
 import sys
 import os
 import platform
+import shutil
+import threading
 from pathlib import Path
-import json
+
+import detect_gpu as gpu_detector
+
+# 해시 고정 의존성 lock 파일 (선택)
+# 생성: pip-compile --generate-hashes -o requirements.lock requirements_cross_platform.txt
+LOCK_FILE = Path("requirements.lock")
+
+# 마지막 패키지 설치 입력 해시 (같으면 재설치 생략)
+INSTALL_STAMP = Path("venv") / ".install_stamp"
+
+
+@functools.lru_cache(maxsize=1)
+def _system():
+    """OS 이름 (실행 중 바뀌지 않으므로 한 번만 조회)"""
+    return platform.system()
 
 
-def run_command(cmd, check=True):
-    """명령 실행 헬퍼"""
-    print(f"실행: {cmd}")
+def run_command(argv, check=True):
+    """명령 실행 헬퍼 (인자 리스트로 직접 실행, 중간 셸 없음, 출력은 실시간 스트리밍)"""
+    print(f"실행: {' '.join(argv)}")
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=check)
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr and result.returncode != 0:
-            print(f"경고: {result.stderr}")
-        return result.returncode == 0
-    except subprocess.CalledProcessError as e:
+        with subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1) as proc:
+            for line in proc.stdout:
+                print(line, end='')
+            returncode = proc.wait()
+    except OSError as e:
         print(f"오류: {e}")
         return False
 
+    if returncode != 0:
+        message = f"명령이 종료 코드 {returncode}로 실패했습니다: {' '.join(argv)}"
+        print(f"오류: {message}" if check else f"경고: {message}")
+    return returncode == 0
+
 
 def check_python_version():
     """Python 버전 확인"""
@@ -44,19 +67,27 @@ def create_venv():
         print("기존 가상환경이 발견되었습니다.")
         response = input("삭제하고 새로 생성하시겠습니까? [y/N]: ")
         if response.lower() == 'y':
-            import shutil
-            shutil.rmtree(venv_path)
+            # 이름만 바꾸고(즉시 완료) 실제 삭제는 백그라운드에서 진행하여 새 가상환경 생성을 바로 시작
+            old_venv_path = venv_path.with_name(f"venv.old.{os.getpid()}")
+            try:
+                os.rename(venv_path, old_venv_path)
+            except OSError:
+                shutil.rmtree(venv_path)
+            else:
+                # daemon이 아니므로 설치가 먼저 끝나도 삭제 완료 후 종료됨
+                threading.Thread(target=shutil.rmtree, args=(old_venv_path,),
+                                 kwargs={'ignore_errors': True}).start()
         else:
             print("기존 가상환경을 사용합니다.")
             return
 
     print("가상환경 생성 중...")
-    run_command(f"{sys.executable} -m venv venv")
+    run_command([sys.executable, "-m", "venv", "venv"])
 
 
 def activate_venv():
     """가상환경 활성화 경로 반환"""
-    system = platform.system()
+    system = _system()
 
     if system == "Windows":
         activate = Path("venv/Scripts/activate.bat")
@@ -72,38 +103,52 @@ def activate_venv():
     return str(python)
 
 
+@functools.lru_cache(maxsize=1)
 def detect_gpu():
-    """GPU 감지 및 정보 반환"""
+    """GPU 감지 및 정보 반환 (설치 과정 전체에서 한 번만 감지)"""
     print("\nGPU 감지 중...")
 
-    # detect_gpu.py 실행
-    result = subprocess.run([sys.executable, "detect_gpu.py"],
-                          capture_output=True, text=True)
+    # detect_gpu 모듈 직접 호출 (별도 Python 프로세스 없이, 최근 감지 결과가 있으면 재사용)
+    gpu_info = gpu_detector.load_cached_config()
+    if gpu_info is None:
+        gpu_info = gpu_detector.get_system_info()
+        gpu_detector.save_config(gpu_info)
+    return gpu_info
+
+
+def _install_fingerprint(gpu_info):
+    """설치 입력(requirements, lock 파일, GPU 정보)의 해시"""
+    digest = hashlib.sha256()
+    for path in (Path("requirements_cross_platform.txt"), LOCK_FILE):
+        if path.exists():
+            digest.update(path.read_bytes())
+    digest.update(json.dumps(gpu_info, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def install_packages(python_exe, gpu_info):
+    """패키지 설치 (입력이 마지막 설치와 같으면 생략)"""
+    fingerprint = _install_fingerprint(gpu_info)
+    if INSTALL_STAMP.exists() and INSTALL_STAMP.read_text(encoding='utf-8').strip() == fingerprint:
+        print("\n✅ 패키지가 이미 설치되어 있습니다 (requirements/GPU 구성 변경 없음). 설치를 건너뜁니다.")
+        return
 
-    # GPU 설정 파일 읽기
-    config_path = Path("config/gpu_config.json")
-    if config_path.exists():
-        with open(config_path, 'r') as f:
-            gpu_info = json.load(f)
-            return gpu_info
-    return None
+    # 필수 패키지 설치가 모두 성공했을 때만 기록 (실패 시 다음 실행에서 재시도)
+    if _install_packages(python_exe, gpu_info):
+        INSTALL_STAMP.write_text(fingerprint, encoding='utf-8')
 
 
-def install_packages(python_exe):
-    """패키지 설치"""
+def _install_packages(python_exe, gpu_info):
+    """패키지 설치 (필수 패키지 설치 성공 여부 반환)"""
     print("\n패키지 설치 시작...")
 
     # pip 업그레이드
     print("pip 업그레이드 중...")
-    run_command(f"{python_exe} -m pip install --upgrade pip setuptools wheel")
+    run_command([python_exe, "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"])
 
-    # 크로스 플랫폼 requirements 설치
-    print("\n기본 패키지 설치 중...")
-    if not run_command(f"{python_exe} -m pip install -r requirements_cross_platform.txt"):
-        print("⚠️ 일부 기본 패키지 설치 실패. 계속 진행합니다.")
-
-    # GPU 정보 기반 패키지 설치
-    gpu_info = detect_gpu()
+    # GPU 정보 기반 패키지 결정
+    torch_index_url = "https://download.pytorch.org/whl/cpu"
+    runtime_packages = ["paddlepaddle==2.5.2", "onnxruntime==1.16.3"]
 
     if gpu_info and gpu_info.get('gpu'):
         gpu = gpu_info['gpu']
@@ -129,27 +174,39 @@ def install_packages(python_exe):
                 cuda_index = 'cu118'  # 기본값
 
             print(f"PyTorch CUDA {cuda_index} 설치 중...")
-            run_command(f"{python_exe} -m pip install torch torchvision --index-url https://download.pytorch.org/whl/{cuda_index}")
-            run_command(f"{python_exe} -m pip install paddlepaddle-gpu==2.5.2")
-            run_command(f"{python_exe} -m pip install onnxruntime-gpu==1.16.3")
+            torch_index_url = f"https://download.pytorch.org/whl/{cuda_index}"
+            runtime_packages = ["paddlepaddle-gpu==2.5.2", "onnxruntime-gpu==1.16.3"]
 
         elif gpu_type == 'apple':
             print("Apple Silicon MPS 지원 버전 설치 중...")
-            run_command(f"{python_exe} -m pip install torch torchvision")
-            run_command(f"{python_exe} -m pip install paddlepaddle==2.5.2")
-            run_command(f"{python_exe} -m pip install onnxruntime==1.16.3")
+            torch_index_url = None
 
         elif gpu_type == 'amd':
             print("AMD ROCm 지원 버전 설치 중...")
-            run_command(f"{python_exe} -m pip install torch torchvision --index-url https://download.pytorch.org/whl/rocm5.6")
-            run_command(f"{python_exe} -m pip install paddlepaddle==2.5.2")
-            run_command(f"{python_exe} -m pip install onnxruntime==1.16.3")
+            torch_index_url = "https://download.pytorch.org/whl/rocm5.6"
 
     else:
         print("\n❌ GPU를 감지하지 못했습니다. CPU 버전 설치 중...")
-        run_command(f"{python_exe} -m pip install torch torchvision --index-url https://download.pytorch.org/whl/cpu")
-        run_command(f"{python_exe} -m pip install paddlepaddle==2.5.2")
-        run_command(f"{python_exe} -m pip install onnxruntime==1.16.3")
+
+    # pip 실행은 인덱스 URL별로 한 번씩만 수행 (resolver/기동 비용 절감)
+    # 1) PyTorch 전용 인덱스 - 다른 패키지가 의존하기 전에 먼저 설치
+    torch_cmd = [python_exe, "-m", "pip", "install", "torch", "torchvision"]
+    if torch_index_url:
+        torch_cmd += ["--index-url", torch_index_url]
+    torch_ok = run_command(torch_cmd)
+
+    # 2) PyPI - 크로스 플랫폼 requirements와 런타임 패키지 설치
+    print("\n기본 패키지 설치 중...")
+    if LOCK_FILE.exists():
+        # 해시 고정 lock 파일이 있으면 의존성 해석 없이 설치
+        # (--require-hashes는 명령행의 해시 없는 패키지를 거부하므로 런타임 패키지는 따로 설치)
+        base_ok = run_command([python_exe, "-m", "pip", "install", "--require-hashes", "-r", str(LOCK_FILE)])
+        base_ok = run_command([python_exe, "-m", "pip", "install", *runtime_packages]) and base_ok
+    else:
+        base_ok = run_command([python_exe, "-m", "pip", "install",
+                               "-r", "requirements_cross_platform.txt", *runtime_packages])
+    if not base_ok:
+        print("⚠️ 일부 기본 패키지 설치 실패. 계속 진행합니다.")
 
     # 선택적 패키지 설치 시도
     print("\n선택적 패키지 설치 시도 중...")
@@ -159,10 +216,16 @@ def install_packages(python_exe):
         ("konlpy", "한국어 NLP (Java 필요)")
     ]
 
-    for package, description in optional_packages:
-        print(f"\n{package} ({description}) 설치 시도...")
-        if not run_command(f"{python_exe} -m pip install {package}", check=False):
-            print(f"⚠️ {package} 설치 실패. {description} 기능이 제한될 수 있습니다.")
+    # 한 번의 pip install로 공통 의존성(pandas 등)을 한 번만 해석/설치
+    # 하나라도 실패하면 나머지는 설치되도록 패키지별로 다시 시도
+    packages = [package for package, _ in optional_packages]
+    if not run_command([python_exe, "-m", "pip", "install", *packages], check=False):
+        for package, description in optional_packages:
+            print(f"\n{package} ({description}) 설치 시도...")
+            if not run_command([python_exe, "-m", "pip", "install", package], check=False):
+                print(f"⚠️ {package} 설치 실패. {description} 기능이 제한될 수 있습니다.")
+
+    return torch_ok and base_ok
 
 
 def create_directories():
@@ -179,19 +242,19 @@ def create_directories():
     ]
 
     for dir_path in directories:
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
-        print(f"✅ {dir_path}")
+        os.makedirs(dir_path, exist_ok=True)
+    print("\n".join(f"✅ {dir_path}" for dir_path in directories))
 
 
 def run_test(python_exe):
     """설치 테스트"""
     print("\n설치 테스트 실행 중...")
-    run_command(f"{python_exe} test_installation.py")
+    run_command([python_exe, "test_installation.py"])
 
 
 def create_launcher_script():
     """실행 스크립트 생성"""
-    system = platform.system()
+    system = _system()
 
     if system == "Windows":
         launcher_path = Path("run.bat")
@@ -222,13 +285,14 @@ def main():
     print("="*60)
     print("Document Layout Analyzer - Cross-Platform Auto Installer")
     print("="*60)
-    print(f"시스템: {platform.system()} {platform.machine()}")
+    print(f"시스템: {_system()} {platform.machine()}")
 
     # 단계별 설치
     check_python_version()
     create_venv()
     python_exe = activate_venv()
-    install_packages(python_exe)
+    gpu_info = detect_gpu()
+    install_packages(python_exe, gpu_info)
     create_directories()
     create_launcher_script()
     run_test(python_exe)
@@ -238,7 +302,7 @@ def main():
     print("✅ 설치 완료!")
     print("="*60)
 
-    system = platform.system()
+    system = _system()
     if system == "Windows":
         print("\n사용 방법:")
         print("1. 가상환경 활성화: venv\\Scripts\\activate.bat")
@@ -253,14 +317,10 @@ def main():
     print("- LibreOffice")
     print("- Java (konlpy/tabula용)")
 
-    # GPU 정보 표시
-    gpu_config_path = Path("config/gpu_config.json")
-    if gpu_config_path.exists():
-        with open(gpu_config_path, 'r') as f:
-            gpu_info = json.load(f)
-            if gpu_info.get('gpu'):
-                print(f"\n🎮 GPU 모드: {gpu_info['gpu']['type'].upper()}")
-                print(f"   {gpu_info['gpu']['name']}")
+    # GPU 정보 표시 (설치 시 감지한 결과 재사용)
+    if gpu_info and gpu_info.get('gpu'):
+        print(f"\n🎮 GPU 모드: {gpu_info['gpu']['type'].upper()}")
+        print(f"   {gpu_info['gpu']['name']}")
 
 
 if __name__ == "__main__":
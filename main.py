@@ -4,26 +4,35 @@ Document Layout Analyzer - Main Application
 CPU/GPU 듀얼 모드 지원 문서 분석 시스템
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import asyncio
 import argparse
+import threading
+from collections import Counter
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 
 # 프로젝트 루트 경로 추가
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root / 'src'))
 
-from src.core.config import ConfigManager, init_config
-from src.core.device_manager import DeviceManager
-from src.parsers import DocumentParserFactory, ProcessingOptions
-from src.analyzers import LayoutAnalyzer
-from src.extractors.content_extractor import ContentExtractor
-from src.core.docjson import DocJSONConverter
+# 분석 컴포넌트는 torch/paddle 등을 함께 로드하므로 필요한 시점에 임포트
+# (--help는 임포트 없이, --info는 설정/디바이스 모듈만 로드)
+if TYPE_CHECKING:
+    from src.parsers import ProcessingOptions
 
 import logging
 
+# 이벤트 루프 가속 (선택, Windows 제외)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -31,17 +40,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 배치 처리 시 동시에 진행할 최대 문서 수 (파싱/저장만 겹치고 모델 추론은 한 문서씩 수행)
+BATCH_CONCURRENCY = 4
+
 
 class DocumentAnalyzer:
     """문서 분석 메인 클래스"""
 
     def __init__(self, config_path: Optional[str] = None):
         """초기화"""
+        from src.core.config import init_config
+        from src.core.device_manager import get_device_manager
+        from src.parsers import DocumentParserFactory
+        from src.analyzers import LayoutAnalyzer
+        from src.extractors.content_extractor import ContentExtractor
+        from src.core.docjson import DocJSONConverter
+
         # 설정 로드
         self.config = init_config(config_path)
 
         # 디바이스 매니저 초기화
-        self.device_manager = DeviceManager()
+        self.device_manager = get_device_manager()
 
         # 컴포넌트 초기화
         self.parser_factory = DocumentParserFactory(self.device_manager, self.config)
@@ -49,13 +68,58 @@ class DocumentAnalyzer:
         self.content_extractor = ContentExtractor(self.device_manager, self.config)
         self.docjson_converter = DocJSONConverter()
 
+        # 레이아웃/추출 모델(Paddle 예측기)은 스레드 안전하지 않으므로 추론은 한 번에 한 문서씩
+        # (여러 문서를 동시에 처리할 때도 파싱과 저장만 겹쳐 수행됨)
+        self._inference_lock = asyncio.Lock()
+
         logger.info("Document Analyzer 초기화 완료")
 
+    async def warm(self):
+        """모델 예열
+
+        첫 문서 처리 시 발생하는 모델 생성 및 추론 초기화 비용(가중치 로드, GPU 컨텍스트 생성 등)을
+        작은 더미 이미지로 미리 치러 둔다. 실패해도 실제 처리에는 영향이 없다.
+        """
+        async with self._inference_lock:
+            await self.layout_analyzer.preload()
+            await asyncio.to_thread(self._warm_models)
+
+    def _warm_models(self):
+        """사용 가능한 모델에 더미 이미지를 한 번씩 통과시킴"""
+        import numpy as np
+
+        dummy = np.full((32, 32, 3), 255, dtype=np.uint8)
+        models = [
+            ("PaddleX", getattr(self.layout_analyzer.paddlex_pipeline, 'predict', None)),
+            ("PaddleOCR (레이아웃)", getattr(self.layout_analyzer.paddleocr_analyzer, 'ocr', None)),
+            ("PaddleOCR (텍스트)", getattr(self.content_extractor.text_extractor, 'ocr', None)),
+        ]
+
+        for name, run in models:
+            if run is None:
+                continue
+            try:
+                result = run(dummy)
+                if hasattr(result, '__next__'):
+                    list(result)  # generator는 소비해야 실제로 추론이 실행됨
+                logger.info(f"{name} 예열 완료")
+            except Exception as e:
+                logger.debug(f"{name} 예열 실패: {e}")
+
+    async def _analyze_layout(self, file_path: Path):
+        """레이아웃 분석 (추론 잠금 안에서 수행)"""
+        async with self._inference_lock:
+            return await self.layout_analyzer.analyze_document(file_path)
+
     async def process_document(self,
                               file_path: str,
                               output_dir: str = "./output",
-                              options: Optional[ProcessingOptions] = None) -> bool:
-        """문서 처리 파이프라인"""
+                              options: Optional[ProcessingOptions] = None,
+                              quiet: bool = False) -> Optional[Path]:
+        """문서 처리 파이프라인 (quiet=True이면 처리 통계 출력 생략)
+
+        성공하면 저장된 DocJSON 파일 경로, 실패하면 None을 반환
+        """
 
         try:
             file_path = Path(file_path)
@@ -69,33 +133,43 @@ class DocumentAnalyzer:
             parser = self.parser_factory.get_parser(file_path)
             if not parser:
                 logger.error(f"지원하지 않는 파일 형식: {file_path}")
-                return False
+                return None
+
+            # 레이아웃 분석은 파일 경로만 필요하므로 파싱과 동시에 시작
+            layout_task = asyncio.create_task(self._analyze_layout(file_path))
+
+            try:
+                parse_result = await parser.parse(file_path, options)
+            except BaseException:
+                layout_task.cancel()
+                raise
 
-            parse_result = await parser.parse(file_path, options)
             if not parse_result.success:
+                layout_task.cancel()
                 logger.error(f"문서 파싱 실패: {parse_result.error}")
-                return False
+                return None
 
             logger.info(f"파싱 완료: {parse_result.processing_time:.2f}초")
 
             # 2. 레이아웃 분석
             logger.info("2. 레이아웃 분석 중...")
-            layout_result = await self.layout_analyzer.analyze_document(file_path)
+            layout_result = await layout_task
             if not layout_result.success:
                 logger.error(f"레이아웃 분석 실패: {layout_result.error}")
-                return False
+                return None
 
             logger.info(f"레이아웃 분석 완료: {len(layout_result.elements)}개 요소, "
                        f"{layout_result.processing_time:.2f}초")
 
             # 3. 콘텐츠 추출
             logger.info("3. 콘텐츠 추출 중...")
-            extraction_result = await self.content_extractor.extract_from_layout(
-                layout_result.elements, file_path
-            )
+            async with self._inference_lock:
+                extraction_result = await self.content_extractor.extract_from_layout(
+                    layout_result.elements, file_path
+                )
             if not extraction_result.success:
                 logger.error(f"콘텐츠 추출 실패: {extraction_result.error}")
-                return False
+                return None
 
             logger.info(f"콘텐츠 추출 완료: {len(extraction_result.content)}개 콘텐츠, "
                        f"{extraction_result.processing_time:.2f}초")
@@ -113,67 +187,101 @@ class DocumentAnalyzer:
             output_filename = file_path.stem + ".docjson"
             output_path = output_dir / output_filename
 
-            if self.docjson_converter.save_docjson(docjson, output_path):
+            # 직렬화/디스크 쓰기는 스레드에서 수행 (배치 처리 중 다른 문서 진행을 막지 않음)
+            if await asyncio.to_thread(self.docjson_converter.save_docjson, docjson, output_path):
                 logger.info(f"DocJSON 저장 완료: {output_path}")
             else:
                 logger.error("DocJSON 저장 실패")
-                return False
+                return None
 
             # 통계 출력
-            self._print_processing_stats(parse_result, layout_result, extraction_result)
+            if not quiet:
+                self._print_processing_stats(parse_result, layout_result, extraction_result)
 
-            return True
+            return output_path
 
         except Exception as e:
             logger.error(f"문서 처리 중 오류: {e}")
-            return False
+            return None
 
     def _print_processing_stats(self, parse_result, layout_result, extraction_result):
-        """처리 통계 출력"""
-        print("\n" + "="*50)
-        print("📊 처리 결과 요약")
-        print("="*50)
-
-        print(f"📄 파싱 결과:")
-        print(f"  - 성공: {parse_result.success}")
-        print(f"  - 페이지 수: {parse_result.pages}")
-        print(f"  - 파일 크기: {parse_result.file_size:,} bytes")
-        print(f"  - 처리 시간: {parse_result.processing_time:.2f}초")
-
-        print(f"\n🔍 레이아웃 분석:")
-        print(f"  - 감지된 요소: {len(layout_result.elements)}개")
-        print(f"  - 분석 방법: {layout_result.method_used}")
-        print(f"  - 처리 시간: {layout_result.processing_time:.2f}초")
-
-        print(f"\n📝 콘텐츠 추출:")
-        print(f"  - 추출된 콘텐츠: {len(extraction_result.content)}개")
-        print(f"  - 처리 시간: {extraction_result.processing_time:.2f}초")
+        """처리 통계 출력 (줄 단위 print 대신 한 번의 write로 출력)"""
+        lines = [
+            "\n" + "="*50,
+            "📊 처리 결과 요약",
+            "="*50,
+            "📄 파싱 결과:",
+            f"  - 성공: {parse_result.success}",
+            f"  - 페이지 수: {parse_result.pages}",
+            f"  - 파일 크기: {parse_result.file_size:,} bytes",
+            f"  - 처리 시간: {parse_result.processing_time:.2f}초",
+            "\n🔍 레이아웃 분석:",
+            f"  - 감지된 요소: {len(layout_result.elements)}개",
+            f"  - 분석 방법: {layout_result.method_used}",
+            f"  - 처리 시간: {layout_result.processing_time:.2f}초",
+            "\n📝 콘텐츠 추출:",
+            f"  - 추출된 콘텐츠: {len(extraction_result.content)}개",
+            f"  - 처리 시간: {extraction_result.processing_time:.2f}초",
+        ]
 
         # 콘텐츠 타입별 통계
-        content_types = {}
-        for content in extraction_result.content:
-            content_type = content.content_type
-            content_types[content_type] = content_types.get(content_type, 0) + 1
+        content_types = Counter(content.content_type for content in extraction_result.content)
 
         if content_types:
-            print(f"\n📊 콘텐츠 타입별 분포:")
-            for content_type, count in content_types.items():
-                print(f"  - {content_type}: {count}개")
+            lines.append("\n📊 콘텐츠 타입별 분포:")
+            lines.extend(f"  - {content_type}: {count}개" for content_type, count in content_types.items())
 
         total_time = (parse_result.processing_time +
                      layout_result.processing_time +
                      extraction_result.processing_time)
-        print(f"\n⏱️ 전체 처리 시간: {total_time:.2f}초")
-        print("="*50)
+        lines.append(f"\n⏱️ 전체 처리 시간: {total_time:.2f}초")
+        lines.append("="*50)
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def print_system_info(self):
         """시스템 정보 출력"""
-        print("🖥️ 시스템 정보")
-        print("="*40)
-        self.config.print_system_info()
-        print()
-        self.device_manager.print_device_info()
-        print()
+        _print_system_info(self.config, self.device_manager)
+
+
+def _print_system_info(config, device_manager):
+    """시스템 정보 출력"""
+    print("🖥️ 시스템 정보")
+    print("="*40)
+    config.print_system_info()
+    print()
+    device_manager.print_device_info()
+    print()
+
+
+async def _ainput(prompt: str) -> str:
+    """이벤트 루프를 막지 않는 input()
+
+    입력 대기 중에도 다른 태스크가 실행되도록 별도 스레드에서 읽는다.
+    Ctrl+C로 종료할 때 입력 스레드를 기다리지 않도록 데몬 스레드를 사용한다.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _resolve(setter, value):
+        if not future.done():
+            setter(value)
+
+    def _read():
+        try:
+            value = input(prompt)
+        except BaseException as e:
+            callback = (_resolve, future.set_exception, e)
+        else:
+            callback = (_resolve, future.set_result, value)
+        try:
+            loop.call_soon_threadsafe(*callback)
+        except RuntimeError:
+            pass  # 이벤트 루프가 이미 종료됨
+
+    threading.Thread(target=_read, daemon=True).start()
+    return await future
 
 
 async def main():
@@ -221,17 +329,25 @@ async def main():
         help="배치 처리할 파일들"
     )
 
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="문서별 처리 통계 출력 생략"
+    )
+
     args = parser.parse_args()
 
     try:
-        # 분석기 초기화
-        analyzer = DocumentAnalyzer(args.config)
-
-        # 시스템 정보 출력
+        # 시스템 정보 출력 (분석 컴포넌트는 로드하지 않음)
         if args.info:
-            analyzer.print_system_info()
+            from src.core.config import init_config
+            from src.core.device_manager import get_device_manager
+            _print_system_info(init_config(args.config), get_device_manager())
             return
 
+        # 분석기 초기화
+        analyzer = DocumentAnalyzer(args.config)
+
         # GPU/CPU 설정 조정
         if args.gpu:
             analyzer.config.system.processing_mode = "gpu"
@@ -247,20 +363,29 @@ async def main():
 
         # 배치 처리
         if args.batch:
-            success_count = 0
             total_count = len(args.batch)
 
             print(f"\n📁 배치 처리 시작: {total_count}개 파일")
             print("-" * 40)
 
-            for i, file_path in enumerate(args.batch, 1):
-                print(f"\n[{i}/{total_count}] 처리 중: {file_path}")
-                success = await analyzer.process_document(file_path, args.output)
-                if success:
-                    success_count += 1
-                    print(f"✅ 성공: {file_path}")
-                else:
-                    print(f"❌ 실패: {file_path}")
+            # 모델 초기화 비용을 첫 파일이 아닌 배치 시작 전에 한 번만 지불
+            await analyzer.warm()
+
+            # 파일들을 동시에 처리 (동시 처리 수 제한, 결과는 완료되는 대로 출력)
+            # 모델 추론은 DocumentAnalyzer의 추론 잠금으로 한 문서씩 수행되고 파싱/저장만 겹쳐짐
+            semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+            async def process_one(i, file_path):
+                async with semaphore:
+                    print(f"\n[{i}/{total_count}] 처리 중: {file_path}")
+                    success = await analyzer.process_document(file_path, args.output, quiet=args.quiet)
+                print(f"✅ 성공: {file_path}" if success else f"❌ 실패: {file_path}")
+                return success
+
+            results = await asyncio.gather(
+                *(process_one(i, file_path) for i, file_path in enumerate(args.batch, 1))
+            )
+            success_count = sum(result is not None for result in results)
 
             print(f"\n📊 배치 처리 완료: {success_count}/{total_count} 성공")
             return
@@ -271,9 +396,12 @@ async def main():
             print("🤖 Document Layout Analyzer")
             print("파일 경로를 입력하세요 (종료: quit)")
 
+            # 사용자가 경로를 입력하는 동안 백그라운드에서 모델 예열
+            warm_task = asyncio.create_task(analyzer.warm())
+
             while True:
                 try:
-                    file_path = input("\n📄 파일 경로: ").strip()
+                    file_path = (await _ainput("\n📄 파일 경로: ")).strip()
                     if file_path.lower() in ['quit', 'exit', 'q']:
                         break
 
@@ -284,13 +412,15 @@ async def main():
                         print(f"❌ 파일을 찾을 수 없습니다: {file_path}")
                         continue
 
-                    success = await analyzer.process_document(file_path, args.output)
+                    # 같은 모델 인스턴스를 동시에 쓰지 않도록 예열이 끝난 뒤 처리
+                    await warm_task
+                    success = await analyzer.process_document(file_path, args.output, quiet=args.quiet)
                     if success:
                         print("✅ 처리 완료!")
                     else:
                         print("❌ 처리 실패!")
 
-                except KeyboardInterrupt:
+                except (KeyboardInterrupt, EOFError):
                     print("\n종료합니다.")
                     break
                 except Exception as e:
@@ -301,7 +431,7 @@ async def main():
                 print(f"❌ 파일을 찾을 수 없습니다: {args.input_file}")
                 return
 
-            success = await analyzer.process_document(args.input_file, args.output)
+            success = await analyzer.process_document(args.input_file, args.output, quiet=args.quiet)
             if success:
                 print("✅ 처리 완료!")
             else:
@@ -320,5 +450,12 @@ if __name__ == "__main__":
     if sys.platform == "win32":
         # Windows에서 ProactorEventLoop 사용
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    elif UVLOOP_AVAILABLE:
+        # POSIX에서는 libuv 기반 이벤트 루프 사용 (설치된 경우)
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        # 이벤트 루프 실행 중 Ctrl+C는 asyncio.run이 태스크 취소 후 다시 발생시킴
+        print("\n사용자에 의해 중단되었습니다.")
\ No newline at end of file
@@ -3,7 +3,7 @@
 Setup Script for Document Layout Analyzer
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 from pathlib import Path
 
 # Read README
@@ -19,6 +19,15 @@ if req_path.exists():
         if line.strip() and not line.startswith('#') and ';' not in line
     ]
 
+# 패키지 목록 (find_packages(where="src") 결과를 고정 - 패키지 추가 시 갱신)
+PACKAGES = [
+    "analyzers",
+    "extractors",
+    "parsers",
+    "rag",
+    "templates",
+]
+
 setup(
     name="doc-layout-analyzer",
     version="1.0.0",
@@ -28,7 +37,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/company/doc-layout-analyzer",
-    packages=find_packages(where="src"),
+    packages=PACKAGES,
     package_dir={"": "src"},
     classifiers=[
         "Development Status :: 4 - Beta",
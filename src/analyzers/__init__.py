@@ -6,6 +6,7 @@ Analyzers Package - 문서 분석 엔진들
 from .layout_analyzer import (
     LayoutAnalyzer,
     LayoutElement,
+    LayoutElementArray,
     LayoutElementType,
     LayoutAnalysisResult
 )
@@ -13,6 +14,7 @@ from .layout_analyzer import (
 __all__ = [
     'LayoutAnalyzer',
     'LayoutElement',
+    'LayoutElementArray',
     'LayoutElementType',
     'LayoutAnalysisResult'
 ]
\ No newline at end of file
@@ -3,36 +3,52 @@ Layout Analyzer - CPU/GPU 듀얼 모드 지원 레이아웃 분석 엔진
 PaddleOCR PP-Structure와 Docling을 이용한 문서 레이아웃 분석
 """
 
+import copy
+import functools
+import gc
+import hashlib
+import importlib.util
 import logging
+import os
+import random
+import sys
 import time
 import asyncio
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union, Tuple
 import numpy as np
-from PIL import Image
+from PIL import Image, ImageSequence
 import io
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from contextlib import aclosing, asynccontextmanager
 from enum import Enum
+from importlib import metadata
+from types import MappingProxyType
 
 # Logger 설정
 logger = logging.getLogger(__name__)
 
+
+def _module_available(name: str) -> bool:
+    """모듈 설치 여부 (임포트하지 않고 확인)"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+# PaddleOCR/PaddleX/Docling은 임포트만으로 수백 MB 메모리와 수 초가 소요되므로
+# 여기서는 설치 여부만 확인하고, 실제 임포트는 분석기 초기화 시 사용할 분석기만 수행
+
 # PaddleOCR 관련
-try:
-    import paddleocr
-    from paddleocr import PaddleOCR
-    PADDLEOCR_AVAILABLE = True
-except ImportError:
-    PADDLEOCR_AVAILABLE = False
+PADDLEOCR_AVAILABLE = _module_available('paddleocr')
+if not PADDLEOCR_AVAILABLE:
     logger.warning("PaddleOCR 라이브러리를 찾을 수 없습니다.")
 
 # PaddleX 관련 (PP-Structure 대체)
-try:
-    import paddlex as pdx
-    PADDLEX_AVAILABLE = True
-except ImportError:
-    PADDLEX_AVAILABLE = False
+PADDLEX_AVAILABLE = _module_available('paddlex')
+if not PADDLEX_AVAILABLE:
     logger.warning("PaddleX 라이브러리를 찾을 수 없습니다.")
 
 from ..core.device_manager import DeviceManager
@@ -41,17 +57,111 @@ from ..core.config import ConfigManager
 # Logger 설정을 먼저
 logger = logging.getLogger(__name__)
 
+# 선택 가속 패키지도 설치 여부만 확인하고 처음 사용할 때 임포트 (numba/llvmlite는 임포트만으로 수백 ms)
+# 레이아웃 분석 결과 디스크 캐시
+DISKCACHE_AVAILABLE = _module_available('diskcache')
+# 이미지 파일 디코딩 가속
+CV2_AVAILABLE = _module_available('cv2')
+# OCR 좌표 변환 JIT 컴파일
+NUMBA_AVAILABLE = _module_available('numba')
+
+# 결과 캐시 위치/유효 기간/최대 크기 (디스크 캐시는 설정으로 켠 경우만), 메모리에 보관할 최대 문서 수
+LAYOUT_CACHE_DIR = Path.home() / ".cache" / "doc_layout_analyzer" / "layout"
+LAYOUT_CACHE_TTL = 7 * 86400
+LAYOUT_CACHE_SIZE_LIMIT = 256 * 1024 * 1024
+LAYOUT_MEMORY_CACHE_SIZE = 128
+
+# PDF 렌더링 기본 목표 해상도 (긴 변 픽셀) 및 배율 범위
+# 인식 모델이 이 이미지에서 글자 영역을 잘라 쓰므로 A4 기준 약 2배 배율이 되도록 설정
+DEFAULT_RENDER_SIDE_LEN = 1680
+RENDER_ZOOM_RANGE = (1.0, 3.0)
+# 렌더링과 OCR을 겹쳐 수행할 때 미리 렌더링해 둘 최대 페이지 수
+PDF_PREFETCH_PAGES = 4
+# 빈 페이지 판정 (설정 ocr.paddleocr.skip_blank_pages를 켠 경우만): 페이지 전체에서 어두운 픽셀
+# (가장 어두운 채널 < BLANK_PAGE_DARK_LEVEL) 비율이 임계값 미만이면 OCR 생략
+# 임계값은 렌더링 해상도 기준 티끌 수십 픽셀 수준으로, 쪽번호 한 글자도 넘도록 보수적으로 설정
+BLANK_PAGE_DARK_LEVEL = 160
+BLANK_PAGE_MAX_DARK_FRACTION = 1e-5
+
+# 일시적 오류 재시도 (GPU 메모리 부족, cuDNN/할당기 오류 등)
+TRANSIENT_ERROR_MARKERS = ('out of memory', 'cuda error', 'cudnn', 'allocator', 'resourceexhausted')
+TRANSIENT_MAX_ATTEMPTS = 3
+TRANSIENT_BASE_DELAY = 0.5
+
+# Paddle GPU 할당기가 보유할 수 있는 장치 메모리 비율, 문서 처리 후 남은 할당량 경고 기준 (MB)
+PADDLE_GPU_MEMORY_FRACTION = 0.8
+PADDLE_RETAINED_WARN_MB = 50
+
 # Docling 관련 (백업)
-try:
-    from docling.document_converter import DocumentConverter
-    DOCLING_AVAILABLE = True
-    logger.info("Docling 라이브러리 사용 가능")
-except ImportError as e:
-    DOCLING_AVAILABLE = False
-    logger.warning(f"Docling 라이브러리를 찾을 수 없습니다: {e}")
-except Exception as e:
-    DOCLING_AVAILABLE = False
-    logger.warning(f"Docling 초기화 실패: {e}")
+DOCLING_AVAILABLE = _module_available('docling')
+if not DOCLING_AVAILABLE:
+    logger.warning("Docling 라이브러리를 찾을 수 없습니다.")
+
+
+@functools.lru_cache(maxsize=None)
+def _package_version(name: str) -> str:
+    """설치된 패키지 버전 (임포트하지 않고 메타데이터에서 조회)"""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return ''
+
+
+def _quads_to_aabb_numpy(points: np.ndarray) -> np.ndarray:
+    """(N, 4, 2) 사각형 좌표를 (N, 4) [x1, y1, x2, y2] bbox로 변환"""
+    return np.concatenate([points.min(axis=1), points.max(axis=1)], axis=1)
+
+
+def _quads_to_aabb_loop(points: np.ndarray) -> np.ndarray:
+    """(N, 4, 2) 사각형 좌표를 (N, 4) [x1, y1, x2, y2] bbox로 변환 (numba JIT용, 중간 배열 없이 한 번 순회)"""
+    n = points.shape[0]
+    out = np.empty((n, 4), dtype=points.dtype)
+    for i in range(n):
+        x1 = x2 = points[i, 0, 0]
+        y1 = y2 = points[i, 0, 1]
+        for j in range(1, points.shape[1]):
+            x = points[i, j, 0]
+            y = points[i, j, 1]
+            x1 = min(x1, x)
+            x2 = max(x2, x)
+            y1 = min(y1, y)
+            y2 = max(y2, y)
+        out[i, 0] = x1
+        out[i, 1] = y1
+        out[i, 2] = x2
+        out[i, 3] = y2
+    return out
+
+
+@functools.lru_cache(maxsize=1)
+def _quads_to_aabb_kernel():
+    """bbox 변환 함수 (numba가 있으면 첫 호출 시 임포트해 JIT 커널 생성, 없으면 NumPy 버전)"""
+    if NUMBA_AVAILABLE:
+        try:
+            import numba
+            return numba.njit(cache=True, fastmath=True)(_quads_to_aabb_loop)
+        except Exception as e:
+            logger.debug(f"numba JIT 커널 생성 실패, NumPy 사용: {e}")
+    return _quads_to_aabb_numpy
+
+
+class _PixmapImage(np.ndarray):
+    """PyMuPDF Pixmap 버퍼를 복사 없이 참조하는 이미지 배열
+
+    Pixmap.samples_mv는 Pixmap이 해제되면 무효가 되는 메모리를 가리키므로
+    배열(및 그 뷰)이 살아 있는 동안 Pixmap 참조를 함께 보관한다.
+    """
+
+    _pixmap = None
+
+    @classmethod
+    def from_pixmap(cls, pix) -> '_PixmapImage':
+        image = np.ndarray(
+            (pix.height, pix.width, pix.n), dtype=np.uint8,
+            buffer=pix.samples_mv, strides=(pix.stride, pix.n, 1)
+        ).view(cls)
+        image._pixmap = pix
+        return image
 
 
 class LayoutElementType(Enum):
@@ -71,9 +181,14 @@ class LayoutElementType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# 요소 타입 <-> 정수 ID (LayoutElementArray.type_ids)
+_ELEMENT_TYPES = tuple(LayoutElementType)
+_ELEMENT_TYPE_IDS = {element_type: i for i, element_type in enumerate(_ELEMENT_TYPES)}
+
+
+@dataclass(frozen=True, slots=True)
 class LayoutElement:
-    """레이아웃 요소"""
+    """레이아웃 요소 (문서당 수천 개가 생성되므로 __dict__ 없이 생성)"""
     element_type: LayoutElementType
     bbox: List[float]  # [x1, y1, x2, y2]
     confidence: float
@@ -82,6 +197,54 @@ class LayoutElement:
     properties: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class LayoutElementArray:
+    """레이아웃 요소 열 단위(SoA) 표현
+
+    bbox/신뢰도/페이지/타입을 연속 배열로 보관해 벡터 연산에 바로 사용할 수 있다.
+    텍스트와 속성은 배열 밖의 리스트로 보관한다.
+    """
+    bboxes: np.ndarray        # (N, 4) float32
+    scores: np.ndarray        # (N,) float32
+    type_ids: np.ndarray      # (N,) int8, _ELEMENT_TYPES 인덱스
+    page_numbers: np.ndarray  # (N,) int32
+    texts: List[Optional[str]]
+    properties: List[Optional[Dict[str, Any]]]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @classmethod
+    def from_elements(cls, elements: List[LayoutElement]) -> 'LayoutElementArray':
+        """LayoutElement 리스트를 열 단위 배열로 변환"""
+        return cls(
+            bboxes=np.asarray([element.bbox for element in elements], dtype=np.float32).reshape(-1, 4),
+            scores=np.fromiter((element.confidence for element in elements), dtype=np.float32, count=len(elements)),
+            type_ids=np.fromiter((_ELEMENT_TYPE_IDS[element.element_type] for element in elements),
+                                 dtype=np.int8, count=len(elements)),
+            page_numbers=np.fromiter((element.page_number for element in elements), dtype=np.int32, count=len(elements)),
+            texts=[element.text for element in elements],
+            properties=[element.properties for element in elements]
+        )
+
+    def to_elements(self) -> List[LayoutElement]:
+        """LayoutElement 리스트로 변환 (기존 API 호환)"""
+        return [
+            LayoutElement(
+                element_type=_ELEMENT_TYPES[type_id],
+                bbox=bbox,
+                confidence=score,
+                page_number=page_number,
+                text=text,
+                properties=properties
+            )
+            for bbox, score, type_id, page_number, text, properties in zip(
+                self.bboxes.tolist(), self.scores.tolist(), self.type_ids.tolist(),
+                self.page_numbers.tolist(), self.texts, self.properties
+            )
+        ]
+
+
 @dataclass
 class LayoutAnalysisResult:
     """레이아웃 분석 결과"""
@@ -91,6 +254,15 @@ class LayoutAnalysisResult:
     processing_time: float = 0.0
     method_used: str = ""
     error: Optional[str] = None
+    # 페이지별 렌더링 배율 (렌더링 이미지 좌표 / 원본 PDF 좌표, 이미지 입력은 1.0)
+    # PaddleOCR 결과 bbox는 이미 이 배율로 나눠 원본 좌표(PDF는 포인트)로 반환됨 (참고용)
+    page_scales: Optional[List[float]] = None
+    attempts: int = 1  # 일시적 오류 재시도를 포함한 분석 시도 횟수
+    failed_pages: int = 0  # 오류로 요소를 얻지 못한 페이지 수 (0이 아니면 결과 캐시에 저장하지 않음)
+
+    def element_array(self) -> LayoutElementArray:
+        """요소를 열 단위 배열로 반환 (bbox/신뢰도 벡터 연산용)"""
+        return LayoutElementArray.from_elements(self.elements or [])
 
 
 class LayoutAnalyzer:
@@ -106,15 +278,30 @@ class LayoutAnalyzer:
         self.paddlex_pipeline = None
         self.docling_analyzer = None
 
-        # 사용 가능한 분석기 확인
+        # 사용 가능한 분석기 확인 (모델 생성은 첫 분석 또는 preload() 시점으로 미룸)
         self.available_analyzers = self._check_available_analyzers()
-
-        # 기본 분석기 설정
-        if self.available_analyzers:
-            self._initialize_analyzers()
-
-        # 커스텀 라벨 매핑
-        self.label_mapper = self._create_label_mapper()
+        self._analyzers_initialized = False
+        self._init_lock = asyncio.Lock()
+        # 초기화 시 결정되는 추론 설정 (결과 캐시 키에 포함)
+        self._use_gpu = False
+        self._use_tensorrt = False
+        # 모든 분석 호출이 공유하는 추론 동시 실행 제한 (이벤트 루프별로 첫 사용 시 생성)
+        self._inference_semaphore = None
+        self._inference_loop = None
+
+        # 커스텀 라벨 매핑 (초기화 후 변경되지 않도록 읽기 전용으로 노출)
+        label_mapping = self._create_label_mapper()
+        self.label_mapper = MappingProxyType(label_mapping)
+        # 파싱 루프에서 반복 사용하는 라벨 조회 (속성/메서드 조회를 한 번만 수행, 프록시 우회)
+        self._lookup_label = label_mapping.get
+        self._unknown = LayoutElementType.UNKNOWN
+
+        # 동일 문서 재분석 방지용 결과 캐시 (문서 내용 해시 기준)
+        self._result_cache = self._create_result_cache()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._blank_pages_skipped = 0
+        self._skip_blank_pages = bool(config is not None and getattr(config.ocr, 'skip_blank_pages', False))
 
         logger.info(f"Layout Analyzer 초기화 완료. 사용 가능한 분석기: {self.available_analyzers}")
 
@@ -136,6 +323,25 @@ class LayoutAnalyzer:
 
         return analyzers
 
+    async def preload(self):
+        """분석기를 미리 초기화 (첫 요청 전에 모델 로드 비용을 치르고 싶을 때)"""
+        await self._ensure_analyzers()
+
+    async def _ensure_analyzers(self):
+        """분석기가 아직 없으면 한 번만 초기화
+
+        동시에 들어온 첫 요청들이 모델을 중복 생성하지 않도록 잠금 안에서 확인한다.
+        모델 로드는 수 초가 걸리므로 이벤트 루프를 막지 않도록 스레드에서 수행한다.
+        """
+        if self._analyzers_initialized:
+            return
+
+        async with self._init_lock:
+            if not self._analyzers_initialized:
+                if self.available_analyzers:
+                    await asyncio.to_thread(self._initialize_analyzers)
+                self._analyzers_initialized = True
+
     def _initialize_analyzers(self):
         """분석기 초기화"""
         # 디바이스 설정
@@ -144,41 +350,253 @@ class LayoutAnalyzer:
             self.current_device = self.device_manager.get_optimal_device(prefer_gpu=True, min_memory_mb=2000)
             use_gpu = self.current_device != "cpu" and self.config.ocr.use_gpu
 
+        # TensorRT(FP16) 엔진은 설정 ocr.paddleocr.use_tensorrt로 명시한 경우에만 CUDA 장치에서 사용
+        use_tensorrt = (self.current_device.startswith("cuda") and self.config is not None
+                        and getattr(self.config.ocr, 'use_tensorrt', False))
+        self._use_gpu, self._use_tensorrt = use_gpu, use_tensorrt
+
+        # 모델 생성 전에 cuDNN 합성곱 알고리즘 선택 방식 고정
+        if self.current_device.startswith("cuda"):
+            self._configure_paddle_cudnn()
+            self._limit_paddle_gpu_memory()
+
         # PaddleX 초기화 (우선순위)
         if "paddlex" in self.available_analyzers:
             try:
-                self.paddlex_pipeline = pdx.create_pipeline('layout_parsing')
-                logger.info(f"PaddleX layout_parsing 파이프라인 초기화 완료")
+                self.paddlex_pipeline = self._create_paddlex_pipeline(use_tensorrt)
+                logger.info(f"PaddleX layout_parsing 파이프라인 초기화 완료 "
+                           f"(백엔드: {self._inference_backend(self.paddlex_pipeline)})")
             except Exception as e:
                 logger.error(f"PaddleX 초기화 실패: {e}")
                 self.paddlex_pipeline = None
 
-        # PaddleOCR 초기화 (백업용)
-        if "paddleocr" in self.available_analyzers:
+        # PaddleOCR 초기화 (백업용, PaddleX를 사용할 수 없을 때만)
+        # analyze_document는 우선순위가 가장 높은 분석기 하나만 사용하므로 나머지는 로드하지 않음
+        if "paddleocr" in self.available_analyzers and not self.paddlex_pipeline:
             try:
-                self.paddleocr_analyzer = PaddleOCR(
-                    use_angle_cls=True,
-                    lang="korean",
-                    det_model_dir=None,  # 기본 모델 사용
-                    rec_model_dir=None,
-                    cls_model_dir=None,
-                )
+                self.paddleocr_analyzer = self._create_paddleocr(use_gpu, use_tensorrt and use_gpu)
 
-                logger.info(f"PaddleOCR 초기화 완료 (GPU: {use_gpu}, Device: {self.current_device})")
+                logger.info(f"PaddleOCR {_package_version('paddleocr')} 초기화 완료 "
+                           f"(GPU: {use_gpu}, Device: {self.current_device}, "
+                           f"백엔드: {self._inference_backend(self.paddleocr_analyzer)})")
 
             except Exception as e:
                 logger.error(f"PaddleOCR 초기화 실패: {e}")
                 self.paddleocr_analyzer = None
 
-        # Docling 초기화 (백업용)
-        if "docling" in self.available_analyzers:
+        # Docling 초기화 (백업용, PaddleX/PaddleOCR를 사용할 수 없을 때만)
+        if "docling" in self.available_analyzers and not (self.paddlex_pipeline or self.paddleocr_analyzer):
             try:
+                from docling.document_converter import DocumentConverter
                 self.docling_analyzer = DocumentConverter()
                 logger.info("Docling 초기화 완료")
             except Exception as e:
                 logger.error(f"Docling 초기화 실패: {e}")
                 self.docling_analyzer = None
 
+    @staticmethod
+    def _configure_paddle_cudnn():
+        """Paddle cuDNN 합성곱 설정
+
+        입력 크기마다 모든 알고리즘을 실측하는 exhaustive search 대신 휴리스틱 선택을 사용한다.
+        페이지마다 이미지 크기가 달라 exhaustive search는 새 크기마다 탐색 비용을 다시 치른다.
+        환경 변수(FLAGS_*)로 다르게 설정된 경우에도 이 값으로 고정된다.
+        """
+        try:
+            import paddle
+            paddle.set_flags({
+                'FLAGS_cudnn_exhaustive_search': False,
+                'FLAGS_cudnn_deterministic': False,
+                'FLAGS_conv_workspace_size_limit': 512,  # MB
+            })
+        except Exception as e:
+            logger.debug(f"Paddle cuDNN 설정 실패: {e}")
+
+    def _limit_paddle_gpu_memory(self):
+        """Paddle GPU 할당기가 잡아 둘 수 있는 메모리 상한 설정 (장치 메모리의 일정 비율)"""
+        try:
+            total_mb = self.device_manager.monitor_memory_usage(self.current_device)["total"]
+            import paddle
+            paddle.set_flags({'FLAGS_gpu_memory_limit_mb': int(total_mb * PADDLE_GPU_MEMORY_FRACTION)})
+        except Exception as e:
+            logger.debug(f"Paddle GPU 메모리 상한 설정 실패: {e}")
+
+    def _create_paddlex_pipeline(self, use_tensorrt: bool = False):
+        """PaddleX 레이아웃 파이프라인 생성 (TensorRT(설정 시) > 고성능 추론 > 기본 순으로 시도)"""
+        # 고성능 추론(HPI)은 모델별로 최적 백엔드(TensorRT/OpenVINO/ONNX Runtime)를 자동 선택
+        # 구버전이거나 HPI 플러그인이 없으면 기본 Paddle Inference로 생성
+        import paddlex as pdx
+
+        candidates = []
+        if use_tensorrt:
+            candidates.append(("TensorRT", dict(use_hpip=True, hpi_config={"backend": "tensorrt"})))
+        candidates.append(("고성능 추론", dict(use_hpip=True)))
+
+        for name, kwargs in candidates:
+            try:
+                return pdx.create_pipeline('layout_parsing', **kwargs)
+            except Exception as e:
+                logger.debug(f"PaddleX {name} 사용 불가: {e}")
+
+        return pdx.create_pipeline('layout_parsing')
+
+    def _create_paddleocr(self, use_gpu: bool, use_tensorrt: bool = False):
+        """PaddleOCR 생성 (TensorRT는 설정한 경우에만 시도하고, 실패하면 기본 설정으로 생성)"""
+        from paddleocr import PaddleOCR
+
+        base_kwargs = dict(
+            use_angle_cls=True,
+            lang="korean",
+            det_model_dir=None,  # 기본 모델 사용
+            rec_model_dir=None,
+            cls_model_dir=None,
+            # 페이지 단위로 한 장씩 처리하므로 CPU에서는 배치 1로 두어 추론 메모리 선할당을 줄임
+            # (여러 페이지 처리 속도는 배치 크기가 아니라 페이지 단위 병렬화로 확보)
+            rec_batch_num=self._rec_batch_num(use_gpu),
+            cls_batch_num=1,
+            cpu_threads=os.cpu_count() or 1,
+        )
+
+        if use_tensorrt:
+            # Paddle Inference TensorRT 서브그래프 엔진 (FP16)
+            # PaddleOCR 2.x 생성자는 인자를 검사하지 않고 엔진은 첫 추론 때 만들어지므로
+            # 생성 후 더미 이미지로 실제 추론해 보고 실패하면 기본 설정으로 다시 생성
+            try:
+                ocr = PaddleOCR(**base_kwargs, use_tensorrt=True, precision="fp16")
+                ocr.ocr(np.full((32, 32, 3), 255, dtype=np.uint8))
+                return ocr
+            except Exception as e:
+                logger.warning(f"PaddleOCR TensorRT 사용 불가, 기본 설정으로 생성: {e}")
+
+        return PaddleOCR(**base_kwargs)
+
+    def _rec_batch_num(self, use_gpu: bool) -> int:
+        """PaddleOCR 인식 배치 크기 (GPU만 설정값 사용)"""
+        if use_gpu and self.config:
+            return getattr(self.config.ocr, 'rec_batch_num', 6)
+        return 1
+
+    def _max_concurrent(self) -> int:
+        """동시에 처리할 최대 페이지/문서 수
+
+        하나의 Paddle 추론 인스턴스를 여러 스레드가 동시에 호출하는 것은 안전하지 않을 수 있어
+        기본값은 1 (설정 ocr.paddleocr.max_concurrent로 조정)
+        """
+        if self.config:
+            return max(1, getattr(self.config.ocr, 'max_concurrent', 1))
+        return 1
+
+    def _inference_slots(self) -> asyncio.Semaphore:
+        """Paddle 추론 호출(ocr/predict)의 동시 실행 제한
+
+        문서마다 따로 만들면 동시에 분석 중인 문서들이 같은 인스턴스를 병렬로 호출하게 되므로
+        인스턴스당 하나를 모든 분석 호출이 공유한다.
+        asyncio 세마포어는 처음 대기한 이벤트 루프에 묶이므로 asyncio.run을 여러 번 호출하는
+        경우를 위해 루프가 바뀌면 새로 만든다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._inference_semaphore is None or self._inference_loop is not loop:
+            self._inference_semaphore = asyncio.Semaphore(self._max_concurrent())
+            self._inference_loop = loop
+        return self._inference_semaphore
+
+    @staticmethod
+    def _inference_backend(model) -> str:
+        """선택된 추론 백엔드 이름 (확인할 수 없으면 'default')"""
+        get_backend = getattr(model, 'get_inference_backend', None)
+        if callable(get_backend):
+            try:
+                return str(get_backend())
+            except Exception:
+                pass
+        return "default"
+
+    def _create_result_cache(self):
+        """결과 캐시 생성
+
+        설정 ocr.layout_analysis.result_cache: "memory"(기본, 프로세스 내), "disk", "off"(사용 안 함).
+        디스크 캐시는 문서 내용이 LAYOUT_CACHE_DIR에 남으므로 명시적으로 켠 경우에만 사용하고
+        크기를 LAYOUT_CACHE_SIZE_LIMIT로 제한한다. diskcache가 없거나 열 수 없으면 메모리 dict를 사용한다.
+        """
+        mode = getattr(self.config.ocr, 'layout_result_cache', 'memory') if self.config else 'memory'
+        if mode == 'off':
+            return None
+        if mode == 'disk' and DISKCACHE_AVAILABLE:
+            try:
+                import diskcache
+                return diskcache.Cache(str(LAYOUT_CACHE_DIR), size_limit=LAYOUT_CACHE_SIZE_LIMIT)
+            except Exception as e:
+                logger.warning(f"레이아웃 결과 디스크 캐시를 열 수 없어 메모리 캐시 사용: {e}")
+        return {}
+
+    def clear_result_cache(self):
+        """레이아웃 결과 캐시 비우기 (디스크 캐시이면 저장된 항목도 삭제)"""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def _selected_method(self) -> Optional[str]:
+        """analyze_document가 사용할 분석 방법"""
+        if self.paddlex_pipeline:
+            return "paddlex"
+        if self.paddleocr_analyzer:
+            return "paddleocr"
+        if self.docling_analyzer:
+            return "docling"
+        return None
+
+    def _result_cache_key(self, document_path: Union[str, Path], method: str) -> str:
+        """문서 내용 + 분석 방법 + 결과에 영향을 주는 설정 기반 캐시 키"""
+        digest = hashlib.blake2b(digest_size=20)
+        with open(document_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+
+        return f"{digest.hexdigest()}:{method}:{self._analysis_fingerprint(method)}"
+
+    def _analysis_fingerprint(self, method: str) -> str:
+        """분석 결과에 영향을 주는 설정의 해시
+
+        모델 버전, 장치(GPU/CPU), 추론 백엔드(TensorRT/FP16 등), 인식 배치 크기,
+        렌더링 해상도, 빈 페이지 생략 여부, 커스텀 라벨 매핑이 다르면 다른 결과로 취급한다.
+        """
+        model = {
+            "paddlex": self.paddlex_pipeline,
+            "paddleocr": self.paddleocr_analyzer,
+            "docling": self.docling_analyzer,
+        }.get(method)
+        parts = (
+            _package_version('paddlex'),
+            _package_version('paddleocr'),
+            _package_version('docling'),
+            self.current_device,
+            f"gpu={self._use_gpu}",
+            f"tensorrt={self._use_tensorrt}",
+            self._inference_backend(model),
+            str(self._rec_batch_num(self._use_gpu)),
+            str(self._render_side_len()),
+            f"skip_blank={self._skip_blank_pages}",
+            repr(sorted((label, element_type.value) for label, element_type in self.label_mapper.items())),
+        )
+        return hashlib.blake2b("\x1f".join(parts).encode('utf-8'), digest_size=8).hexdigest()
+
+    def _cache_get(self, key: str):
+        """캐시 조회 (없으면 None)"""
+        cached = self._result_cache.get(key)
+        if cached is not None and isinstance(self._result_cache, dict):
+            # 메모리 캐시는 같은 객체를 돌려주므로 호출 측 수정이 캐시에 남지 않도록 복사
+            cached = copy.deepcopy(cached)
+        return cached
+
+    def _cache_set(self, key: str, value):
+        """캐시 저장"""
+        if isinstance(self._result_cache, dict):
+            if len(self._result_cache) >= LAYOUT_MEMORY_CACHE_SIZE:
+                # 가장 먼저 저장된 항목 제거
+                self._result_cache.pop(next(iter(self._result_cache)))
+            self._result_cache[key] = copy.deepcopy(value)
+        else:
+            self._result_cache.set(key, value, expire=LAYOUT_CACHE_TTL)
+
     def _create_label_mapper(self) -> Dict[str, LayoutElementType]:
         """커스텀 라벨 매핑 생성"""
         # 기본 라벨 매핑
@@ -220,38 +638,86 @@ class LayoutAnalyzer:
         start_time = time.time()
 
         try:
-            # 이미지 준비
-            if page_images is None:
-                page_images = await self._convert_document_to_images(document_path)
-
-            if not page_images:
-                return LayoutAnalysisResult(
-                    success=False,
-                    error="문서를 이미지로 변환할 수 없습니다."
+            # 문서 파일로부터 분석하는 경우에만 결과 캐시 사용 (이미지를 직접 받으면 내용이 다를 수 있음)
+            await self._ensure_analyzers()
+
+            cache_key = None
+            method = self._selected_method()
+            if page_images is None and method and self._result_cache is not None:
+                try:
+                    cache_key = await asyncio.to_thread(self._result_cache_key, document_path, method)
+                    cached = await asyncio.to_thread(self._cache_get, cache_key)
+                except Exception as e:
+                    logger.debug(f"레이아웃 결과 캐시 조회 실패: {e}")
+                    cache_key, cached = None, None
+
+                if cached is not None:
+                    self._cache_hits += 1
+                    elements, page_count, page_scales = cached
+                    logger.info(f"레이아웃 분석 캐시 사용: {len(elements)}개 요소, 방법: {method}")
+                    return LayoutAnalysisResult(
+                        success=True,
+                        elements=elements,
+                        page_count=page_count,
+                        processing_time=time.time() - start_time,
+                        method_used=method,
+                        page_scales=page_scales
+                    )
+                self._cache_misses += 1
+
+            # PaddleOCR로 PDF를 분석할 때는 페이지 렌더링과 OCR을 겹쳐서 수행
+            if (page_images is None and method == "paddleocr"
+                    and Path(document_path).suffix.lower() == '.pdf'):
+                result = await self._retry_transient(
+                    lambda: self._analyze_pdf_with_paddleocr(Path(document_path))
                 )
-
-            # 분석 방법 선택 및 실행 (우선순위: PaddleX > PaddleOCR > Docling)
-            if self.paddlex_pipeline:
-                result = await self._analyze_with_paddlex(page_images, document_path)
-                result.method_used = "paddlex"
-            elif self.paddleocr_analyzer:
-                result = await self._analyze_with_paddleocr(page_images)
                 result.method_used = "paddleocr"
-            elif self.docling_analyzer:
-                result = await self._analyze_with_docling(document_path)
-                result.method_used = "docling"
             else:
-                return LayoutAnalysisResult(
-                    success=False,
-                    error="사용 가능한 레이아웃 분석기가 없습니다."
-                )
+                # 이미지 준비
+                if page_images is None:
+                    page_images, page_scales = await self._convert_document_to_images(document_path)
+                else:
+                    page_images = [self._as_rgb_uint8(page_image) for page_image in page_images]
+                    page_scales = [1.0] * len(page_images)
+
+                if not page_images:
+                    return LayoutAnalysisResult(
+                        success=False,
+                        error="문서를 이미지로 변환할 수 없습니다."
+                    )
+
+                # 분석 방법 선택 및 실행 (우선순위: PaddleX > PaddleOCR > Docling)
+                # GPU 메모리 부족 등 일시적 오류는 메모리 정리 후 재시도
+                if self.paddlex_pipeline:
+                    result = await self._retry_transient(lambda: self._analyze_with_paddlex(page_images, document_path))
+                    result.method_used = "paddlex"
+                elif self.paddleocr_analyzer:
+                    result = await self._retry_transient(lambda: self._analyze_with_paddleocr(page_images, page_scales))
+                    result.method_used = "paddleocr"
+                elif self.docling_analyzer:
+                    result = await self._retry_transient(lambda: self._analyze_with_docling(document_path))
+                    result.method_used = "docling"
+                else:
+                    return LayoutAnalysisResult(
+                        success=False,
+                        error="사용 가능한 레이아웃 분석기가 없습니다."
+                    )
+
+                result.page_count = len(page_images)
+                result.page_scales = page_scales
 
             result.processing_time = time.time() - start_time
-            result.page_count = len(page_images)
 
-            logger.info(f"레이아웃 분석 완료: {len(result.elements)}개 요소, "
+            logger.info(f"레이아웃 분석 완료: {len(result.elements or [])}개 요소, "
                        f"{result.processing_time:.2f}초, 방법: {result.method_used}")
 
+            # 일부 페이지가 실패한 결과는 저장하지 않음 (다음 실행에서 다시 분석)
+            if cache_key and result.success and not result.failed_pages:
+                try:
+                    await asyncio.to_thread(self._cache_set, cache_key, (result.elements, result.page_count, result.page_scales))
+                except Exception as e:
+                    logger.debug(f"레이아웃 결과 캐시 저장 실패: {e}")
+
             return result
 
         except Exception as e:
@@ -262,49 +728,78 @@ class LayoutAnalyzer:
                 processing_time=time.time() - start_time
             )
 
+    @staticmethod
+    def _is_transient_error(error) -> bool:
+        """재시도로 해결될 수 있는 오류인지 (GPU 메모리 부족, cuDNN/할당기 오류 등)"""
+        message = str(error).lower()
+        return any(marker in message for marker in TRANSIENT_ERROR_MARKERS)
+
+    async def _retry_transient(self, analyze,
+                               max_attempts: int = TRANSIENT_MAX_ATTEMPTS,
+                               base_delay: float = TRANSIENT_BASE_DELAY) -> LayoutAnalysisResult:
+        """일시적 오류 시 지수 백오프로 재시도
+
+        analyze는 호출할 때마다 새 코루틴을 만드는 함수. 분석 함수는 오류를 결과로 반환하므로
+        예외와 실패 결과 모두 오류 메시지로 일시적 오류 여부를 판단한다.
+        일시적 오류가 아니면 바로 반환(또는 예외 전파)한다.
+        """
+        for attempt in range(1, max_attempts + 1):
+            try:
+                result = await analyze()
+                error = None if result.success else result.error
+            except Exception as e:
+                if attempt == max_attempts or not self._is_transient_error(e):
+                    raise
+                error = e
+            else:
+                if error is None or attempt == max_attempts or not self._is_transient_error(error):
+                    result.attempts = attempt
+                    return result
+
+            delay = base_delay * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+            logger.warning(f"레이아웃 분석 일시적 오류 ({attempt}/{max_attempts}), "
+                          f"{delay:.2f}초 후 재시도: {error}")
+            self.cleanup_memory()
+            await asyncio.sleep(delay)
+
     async def _analyze_with_paddlex(self, page_images: List[np.ndarray], document_path: Union[str, Path]) -> LayoutAnalysisResult:
         """PaddleX를 이용한 레이아웃 분석"""
         elements = []
 
         try:
             logger.info(f"PaddleX 분석 시작: {document_path}")
-            logger.info(f"페이지 이미지 수: {len(page_images) if page_images else 'None'}")
+            # 결과 구조 확인용 로그는 DEBUG일 때만 만듦 (f-string은 로그 레벨과 무관하게 평가되므로)
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(f"페이지 이미지 수: {len(page_images) if page_images else 'None'}")
 
             # 문서 경로로 직접 분석 (PaddleX는 파일 경로를 받음)
-            result = await asyncio.to_thread(
-                self.paddlex_pipeline.predict, str(document_path)
-            )
-
-            logger.info(f"PaddleX 원시 결과 타입: {type(result)}")
-
-            # PaddleX는 generator를 반환하므로 list로 변환
-            if result:
-                result_list = list(result)
-                logger.info(f"PaddleX 결과 페이지 수: {len(result_list)}")
+            # predict는 generator를 반환하고 실제 추론은 소비할 때 일어나므로 스레드 안에서 list로 변환
+            async with self._inference_slots():
+                result_list = await asyncio.to_thread(
+                    lambda: list(self.paddlex_pipeline.predict(str(document_path)) or [])
+                )
 
+            failed_pages = 0
+            if result_list:
                 for page_num, page_result in enumerate(result_list):
-                    logger.info(f"PaddleX 페이지 {page_num + 1} 결과 구조: {type(page_result)}")
-                    logger.info(f"PaddleX 페이지 {page_num + 1} 키: {list(page_result.keys()) if hasattr(page_result, 'keys') else 'No keys'}")
-
-                    # 결과 내용 로깅 (처음 몇 줄만)
-                    if hasattr(page_result, 'keys'):
-                        for key, value in page_result.items():
-                            if isinstance(value, list):
-                                logger.info(f"  {key}: {len(value)} items")
-                                if len(value) > 0:
-                                    logger.info(f"    첫 번째 항목: {type(value[0])}")
-                                    if hasattr(value[0], 'keys'):
-                                        logger.info(f"    첫 번째 항목 키: {list(value[0].keys())}")
-                            else:
-                                logger.info(f"  {key}: {type(value)} - {str(value)[:100]}")
+                    if debug:
+                        self._log_paddlex_page_structure(page_result, page_num)
 
                     page_elements = self._parse_paddlex_result(page_result, page_num)
+                    if page_elements is None:
+                        failed_pages += 1
+                        continue
                     elements.extend(page_elements)
-                    logger.info(f"PaddleX 페이지 {page_num + 1}에서 추출된 요소: {len(page_elements)}개")
+                    if debug:
+                        logger.debug(f"PaddleX 페이지 {page_num + 1}에서 추출된 요소: {len(page_elements)}개")
+
+                logger.info(f"PaddleX 결과: {len(result_list)}페이지, {len(elements)}개 요소")
 
             return LayoutAnalysisResult(
                 success=True,
-                elements=elements
+                elements=elements,
+                failed_pages=failed_pages
             )
 
         except Exception as e:
@@ -314,52 +809,80 @@ class LayoutAnalyzer:
                 error=str(e)
             )
 
-    def _parse_paddlex_result(self, page_result: Dict[str, Any], page_num: int) -> List[LayoutElement]:
-        """PaddleX 결과 파싱"""
+    @staticmethod
+    def _log_paddlex_page_structure(page_result, page_num: int):
+        """PaddleX 페이지 결과 구조 로깅 (개발용, DEBUG)"""
+        logger.debug(f"PaddleX 페이지 {page_num + 1} 결과 구조: {type(page_result)}")
+        logger.debug(f"PaddleX 페이지 {page_num + 1} 키: {list(page_result.keys()) if hasattr(page_result, 'keys') else 'No keys'}")
+
+        # 결과 내용 로깅 (처음 몇 줄만)
+        if hasattr(page_result, 'keys'):
+            for key, value in page_result.items():
+                if isinstance(value, list):
+                    logger.debug(f"  {key}: {len(value)} items")
+                    if len(value) > 0:
+                        logger.debug(f"    첫 번째 항목: {type(value[0])}")
+                        if hasattr(value[0], 'keys'):
+                            logger.debug(f"    첫 번째 항목 키: {list(value[0].keys())}")
+                else:
+                    logger.debug(f"  {key}: {type(value)} - {str(value)[:100]}")
+
+    def _parse_paddlex_result(self, page_result: Dict[str, Any], page_num: int) -> Optional[List[LayoutElement]]:
+        """PaddleX 결과 파싱 (실패하면 None)"""
         elements = []
 
         try:
-            # Layout detection results
+            page_number = page_num + 1
+
+            # Layout detection results (박스/라벨/점수를 열 단위로 한 번에 변환)
             if 'layout_det_res' in page_result and page_result['layout_det_res']:
                 layout_det = page_result['layout_det_res']
                 if hasattr(layout_det, 'boxes') and hasattr(layout_det, 'labels'):
-                    for i in range(len(layout_det.boxes)):
-                        box = layout_det.boxes[i]
-                        label = layout_det.labels[i] if i < len(layout_det.labels) else 'unknown'
-                        score = layout_det.scores[i] if hasattr(layout_det, 'scores') and i < len(layout_det.scores) else 0.0
-
-                        element = LayoutElement(
-                            element_type=self.label_mapper.get(label, LayoutElementType.UNKNOWN),
-                            bbox=[float(box[0]), float(box[1]), float(box[2]), float(box[3])],
-                            confidence=float(score),
-                            page_number=page_num + 1,
+                    bboxes = self._bbox_rows(layout_det.boxes)
+                    count = len(bboxes)
+                    labels = list(layout_det.labels[:count])
+                    labels += ['unknown'] * (count - len(labels))
+                    scores = self._float_column(getattr(layout_det, 'scores', ()), count, 0.0)
+                    lookup, unknown = self._lookup_label, self._unknown
+                    element_types = [lookup(label, unknown) for label in labels]
+
+                    elements.extend(
+                        LayoutElement(
+                            element_type=element_type,
+                            bbox=bbox,
+                            confidence=score,
+                            page_number=page_number,
                             properties={
                                 'original_label': label,
                                 'source': 'paddlex_layout_det'
                             }
                         )
-                        elements.append(element)
+                        for element_type, bbox, score, label in zip(element_types, bboxes, scores, labels)
+                    )
 
             # OCR results
             if 'overall_ocr_res' in page_result and page_result['overall_ocr_res']:
                 ocr_res = page_result['overall_ocr_res']
                 if hasattr(ocr_res, 'boxes') and hasattr(ocr_res, 'texts'):
-                    for i in range(len(ocr_res.boxes)):
-                        box = ocr_res.boxes[i]
-                        text = ocr_res.texts[i] if i < len(ocr_res.texts) else ''
-                        score = ocr_res.scores[i] if hasattr(ocr_res, 'scores') and i < len(ocr_res.scores) else 0.9
-
-                        element = LayoutElement(
+                    bboxes = self._bbox_rows(ocr_res.boxes)
+                    count = len(bboxes)
+                    texts = list(ocr_res.texts[:count])
+                    texts += [''] * (count - len(texts))
+                    scores = self._float_column(getattr(ocr_res, 'scores', ()), count, 0.9)
+
+                    elements.extend(
+                        LayoutElement(
                             element_type=LayoutElementType.TEXT,
-                            bbox=[float(box[0]), float(box[1]), float(box[2]), float(box[3])],
-                            confidence=float(score),
-                            page_number=page_num + 1,
+                            bbox=bbox,
+                            confidence=score,
+                            page_number=page_number,
                             text=text,
                             properties={
                                 'source': 'paddlex_ocr'
                             }
                         )
-                        elements.append(element)
+                        for bbox, score, text in zip(bboxes, scores, texts)
+                    )
 
             # Parsing results (structured content)
             if 'parsing_res_list' in page_result and page_result['parsing_res_list']:
@@ -370,10 +893,10 @@ class LayoutAnalyzer:
                         label = parsing_item.get('block_label', 'text')
 
                         element = LayoutElement(
-                            element_type=self.label_mapper.get(label, LayoutElementType.UNKNOWN),
+                            element_type=self._lookup_label(label, self._unknown),
                             bbox=bbox,
                             confidence=0.9,
-                            page_number=page_num + 1,
+                            page_number=page_number,
                             text=content,
                             properties={
                                 'original_label': label,
@@ -394,7 +917,7 @@ class LayoutAnalyzer:
                             element_type=LayoutElementType.TABLE,
                             bbox=bbox,
                             confidence=0.9,
-                            page_number=page_num + 1,
+                            page_number=page_number,
                             text=table_item['pred_html'],
                             properties={
                                 'source': 'paddlex_table',
@@ -406,9 +929,26 @@ class LayoutAnalyzer:
 
         except Exception as e:
             logger.error(f"PaddleX 결과 파싱 실패: {e}")
+            return None
 
         return elements
 
+    @staticmethod
+    def _bbox_rows(boxes) -> List[List[float]]:
+        """(N, 4 이상) 박스 배열의 앞 4개 값을 [x1, y1, x2, y2] float 리스트로 일괄 변환"""
+        if len(boxes) == 0:
+            return []
+        array = np.asarray(boxes, dtype=np.float64)
+        if array.ndim != 2 or array.shape[1] < 4:
+            raise ValueError(f"지원하지 않는 박스 형식: {array.shape}")
+        return array[:, :4].tolist()
+
+    @staticmethod
+    def _float_column(values, count: int, default: float) -> List[float]:
+        """값 배열을 count 길이의 float 리스트로 변환 (부족한 항목은 default)"""
+        column = np.asarray(values[:count], dtype=np.float64).tolist() if len(values) else []
+        return column + [default] * (count - len(column))
+
     def _parse_paddlex_layout_item(self, item: Dict[str, Any], page_num: int) -> Optional[LayoutElement]:
         """PaddleX 레이아웃 아이템 파싱"""
         try:
@@ -418,7 +958,7 @@ class LayoutAnalyzer:
 
             # 라벨 매핑
             label = item.get('label', 'text')
-            element_type = self.label_mapper.get(label, LayoutElementType.UNKNOWN)
+            element_type = self._lookup_label(label, self._unknown)
 
             confidence = item.get('score', item.get('confidence', 0.0))
 
@@ -463,59 +1003,140 @@ class LayoutAnalyzer:
             logger.debug(f"PaddleX OCR 아이템 파싱 실패: {e}")
             return None
 
-    async def _analyze_with_paddleocr(self, page_images: List[np.ndarray]) -> LayoutAnalysisResult:
-        """PaddleOCR PP-Structure를 이용한 분석"""
-        elements = []
+    async def _analyze_with_paddleocr(self, page_images: List[np.ndarray],
+                                      page_scales: Optional[List[float]] = None) -> LayoutAnalysisResult:
+        """PaddleOCR PP-Structure를 이용한 분석 (bbox는 page_scales로 나눠 원본 좌표로 반환)"""
+        semaphore = self._inference_slots()
+        page_scales = page_scales or [1.0] * len(page_images)
+
+        async def analyze_page(page_num: int, page_image: np.ndarray) -> Optional[List[LayoutElement]]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._process_page_with_paddleocr, page_image, page_num, page_scales[page_num]
+                )
+
+        try:
+            # 설정으로 켠 경우 빈 페이지(구분용 간지 등)는 OCR 없이 건너뜀
+            pages = [(page_num, page_image) for page_num, page_image in enumerate(page_images)
+                     if not (self._skip_blank_pages and self._is_blank_page(page_image))]
+            self._log_blank_pages(len(page_images) - len(pages))
+
+            # 페이지별 분석을 동시 실행 수 제한 내에서 병렬 처리 (결과는 페이지 순서 유지)
+            page_results = await asyncio.gather(
+                *(analyze_page(page_num, page_image) for page_num, page_image in pages)
+            )
+            elements = [element for page_elements in page_results if page_elements for element in page_elements]
+
+            return LayoutAnalysisResult(
+                success=True,
+                elements=elements,
+                failed_pages=sum(page_elements is None for page_elements in page_results)
+            )
+
+        except Exception as e:
+            logger.error(f"PaddleOCR 분석 실패: {e}")
+            return LayoutAnalysisResult(
+                success=False,
+                error=str(e)
+            )
+
+    async def _analyze_pdf_with_paddleocr(self, pdf_path: Path) -> LayoutAnalysisResult:
+        """PDF를 렌더링되는 페이지부터 바로 PaddleOCR로 분석
+
+        렌더링(CPU)과 OCR 추론을 겹쳐 수행해 첫 페이지 OCR이 마지막 페이지 렌더링을 기다리지 않는다.
+        OCR 동시 실행 수만큼만 다음 페이지를 가져오므로 메모리에 올라가는 페이지 수도 제한된다.
+        """
+        semaphore = self._inference_slots()
+        tasks = []
+        page_scales = []
+        blank_pages = 0
+
+        async def analyze_page(page_num: int, page_image: np.ndarray, zoom: float) -> Optional[List[LayoutElement]]:
+            return await asyncio.to_thread(
+                self._process_page_with_paddleocr, page_image, page_num, zoom
+            )
 
         try:
-            for page_num, page_image in enumerate(page_images):
-                # PP-Structure로 레이아웃 분석
-                page_elements = await asyncio.to_thread(
-                    self._process_page_with_paddleocr, page_image, page_num
+            async with aclosing(self._iter_pdf_pages(pdf_path)) as pages:
+                async for page_num, page_image, zoom in pages:
+                    page_scales.append(zoom)
+                    if self._skip_blank_pages and self._is_blank_page(page_image):
+                        blank_pages += 1
+                        continue
+                    await semaphore.acquire()
+                    task = asyncio.create_task(analyze_page(page_num, page_image, zoom))
+                    # 시작 전에 취소된 태스크도 슬롯을 반환하도록 완료 콜백에서 해제 (공유 세마포어)
+                    task.add_done_callback(lambda _: semaphore.release())
+                    tasks.append(task)
+
+            page_results = await asyncio.gather(*tasks)
+            elements = [element for page_elements in page_results if page_elements for element in page_elements]
+            self._log_blank_pages(blank_pages)
+
+            if not page_scales:
+                return LayoutAnalysisResult(
+                    success=False,
+                    error="문서를 이미지로 변환할 수 없습니다."
                 )
-                elements.extend(page_elements)
 
             return LayoutAnalysisResult(
                 success=True,
-                elements=elements
+                elements=elements,
+                page_count=len(page_scales),
+                page_scales=page_scales,
+                failed_pages=sum(page_elements is None for page_elements in page_results)
             )
 
         except Exception as e:
+            for task in tasks:
+                task.cancel()
             logger.error(f"PaddleOCR 분석 실패: {e}")
             return LayoutAnalysisResult(
                 success=False,
                 error=str(e)
             )
 
-    def _process_page_with_paddleocr(self, page_image: np.ndarray, page_num: int) -> List[LayoutElement]:
-        """PaddleOCR로 페이지 분석"""
+    @staticmethod
+    def _is_blank_page(page_image: np.ndarray) -> bool:
+        """빈 페이지 여부 (페이지 전체에서 어두운 픽셀이 거의 없으면 빈 페이지)"""
+        if page_image.size == 0:
+            return True
+        dark_pixels = np.count_nonzero(page_image.min(axis=2) < BLANK_PAGE_DARK_LEVEL)
+        return dark_pixels < BLANK_PAGE_MAX_DARK_FRACTION * page_image.shape[0] * page_image.shape[1]
+
+    def _log_blank_pages(self, count: int):
+        """건너뛴 빈 페이지 수 기록"""
+        if count:
+            self._blank_pages_skipped += count
+            logger.info(f"빈 페이지 {count}개는 OCR을 건너뜀")
+
+    def _process_page_with_paddleocr(self, page_image: np.ndarray, page_num: int,
+                                     scale: float = 1.0) -> Optional[List[LayoutElement]]:
+        """PaddleOCR로 페이지 분석 (scale: 렌더링 배율, bbox를 원본 좌표로 되돌릴 때 사용)
+
+        실패하면 None을 반환하되, 일시적 오류(GPU 메모리 부족 등)는 예외로 전파한다.
+        """
         elements = []
 
         try:
-            # PIL Image로 변환
-            if isinstance(page_image, np.ndarray):
-                pil_image = Image.fromarray(page_image)
-            else:
-                pil_image = page_image
+            # 호출부에서 이미 정규화한 이미지는 복사 없이 그대로 통과 (형식이 맞지 않으면 ValueError)
+            page_image = self._as_rgb_uint8(page_image)
 
             # 기본 PaddleOCR 사용
-            result = self.paddleocr_analyzer.ocr(np.array(pil_image))
+            result = self.paddleocr_analyzer.ocr(page_image)
 
             # OCR 결과를 레이아웃 형식으로 변환
             if result and len(result) > 0:
-                for line_result in result[0]:
-                    element = self._parse_paddleocr_ocr_item(line_result, page_num)
-                    if element:
-                        elements.append(element)
+                elements = self._parse_paddleocr_page_batch(result[0], page_num, scale)
 
             return elements
 
-            # 결과는 위에서 처리됨
-
         except Exception as e:
+            # GPU 메모리 부족 등 일시적 오류는 전파해 문서 단위 재시도(_retry_transient)가 처리하도록 함
+            if self._is_transient_error(e):
+                raise
             logger.error(f"PaddleOCR 페이지 {page_num + 1} 분석 실패: {e}")
-
-        return elements
+            return None
 
     def _convert_ocr_to_layout_format(self, ocr_result, page_num: int) -> List[Dict[str, Any]]:
         """OCR 결과를 레이아웃 형식으로 변환"""
@@ -548,7 +1169,7 @@ class LayoutAnalyzer:
 
             # 라벨 매핑
             label = layout_item.get('label', 'text')
-            element_type = self.label_mapper.get(label, LayoutElementType.UNKNOWN)
+            element_type = self._lookup_label(label, self._unknown)
 
             confidence = layout_item.get('confidence', 0.0)
 
@@ -604,6 +1225,66 @@ class LayoutAnalyzer:
             logger.debug(f"OCR 아이템 파싱 실패: {e}")
             return None
 
+    def _parse_paddleocr_page_batch(self, page_result, page_num: int, scale: float = 1.0) -> List[LayoutElement]:
+        """PaddleOCR 페이지 결과 일괄 파싱
+
+        사각형 좌표를 (N, 4, 2) 배열로 모아 bbox 최소/최대값을 한 번에 계산한다 (numba가 있으면 JIT 커널).
+        4점 형식이 아닌 항목은 _parse_paddleocr_ocr_item으로 개별 처리한다 (결과 순서는 유지).
+        bbox는 렌더링 배율(scale)로 나눠 원본 좌표로 반환한다.
+        """
+        if not page_result:
+            return []
+
+        parsed: List[Optional[LayoutElement]] = [None] * len(page_result)
+        quad_indices = []
+        quads = []
+
+        for i, ocr_item in enumerate(page_result):
+            if (isinstance(ocr_item, list) and len(ocr_item) >= 2
+                    and isinstance(ocr_item[0], list) and len(ocr_item[0]) == 4):
+                quad_indices.append(i)
+                quads.append(ocr_item[0])
+            else:
+                parsed[i] = self._unscale_element(self._parse_paddleocr_ocr_item(ocr_item, page_num), scale)
+
+        if quads:
+            try:
+                points = np.asarray(quads, dtype=np.float64)  # (N, 4, 2)
+                if points.ndim != 3 or points.shape[2] < 2:
+                    raise ValueError(f"예상하지 못한 좌표 배열 형태: {points.shape}")
+                bboxes = _quads_to_aabb_kernel()(points)
+                if scale != 1.0:
+                    bboxes /= scale
+                bboxes = bboxes.tolist()
+            except (ValueError, TypeError) as e:
+                # 좌표 형식이 섞여 있으면 항목별 파싱으로 처리
+                logger.debug(f"OCR 좌표 일괄 변환 실패, 개별 파싱: {e}")
+                for i in quad_indices:
+                    parsed[i] = self._unscale_element(self._parse_paddleocr_ocr_item(page_result[i], page_num), scale)
+            else:
+                for i, bbox in zip(quad_indices, bboxes):
+                    text_info = page_result[i][1]  # (text, confidence)
+                    is_tuple = isinstance(text_info, tuple)
+                    parsed[i] = LayoutElement(
+                        element_type=LayoutElementType.TEXT,
+                        bbox=bbox,
+                        confidence=text_info[1] if is_tuple and len(text_info) > 1 else 0.9,
+                        page_number=page_num + 1,
+                        text=text_info[0] if is_tuple else text_info,
+                        properties={
+                            'source': 'paddleocr_ocr'
+                        }
+                    )
+
+        return [element for element in parsed if element]
+
+    @staticmethod
+    def _unscale_element(element: Optional[LayoutElement], scale: float) -> Optional[LayoutElement]:
+        """렌더링 이미지 좌표의 bbox를 원본 좌표로 변환"""
+        if element is None or scale == 1.0:
+            return element
+        return replace(element, bbox=[coord / scale for coord in element.bbox])
+
     async def _analyze_with_docling(self, document_path: Union[str, Path]) -> LayoutAnalysisResult:
         """Docling을 이용한 분석 (백업)"""
         elements = []
@@ -640,94 +1321,250 @@ class LayoutAnalyzer:
 
         return elements
 
-    async def _convert_document_to_images(self, document_path: Union[str, Path]) -> List[np.ndarray]:
-        """문서를 페이지별 이미지로 변환"""
+    @staticmethod
+    def _as_rgb_uint8(image) -> np.ndarray:
+        """페이지 이미지를 C 연속 uint8 RGB(HWC) 배열로 정규화 (이미 해당 형식이면 복사하지 않음)"""
+        if isinstance(image, Image.Image):
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            return np.ascontiguousarray(np.asarray(image, dtype=np.uint8))
+
+        array = np.asarray(image)
+        if array.ndim not in (2, 3):
+            raise ValueError(f"지원하지 않는 페이지 이미지 형태: {array.shape}")
+        if array.ndim == 2:
+            array = np.repeat(array[:, :, None], 3, axis=2)
+        elif array.shape[2] == 1:
+            array = np.repeat(array, 3, axis=2)
+        elif array.shape[2] == 4:
+            array = array[:, :, :3]  # 알파 채널 제거
+
+        if array.shape[2] != 3:
+            raise ValueError(f"지원하지 않는 페이지 이미지 형태: {array.shape}")
+
+        if array.dtype == np.uint16:
+            array = (array >> 8).astype(np.uint8)
+        elif array.dtype != np.uint8:
+            array = np.clip(array, 0, 255).astype(np.uint8)
+
+        return np.ascontiguousarray(array)
+
+    # 확장자별 이미지 변환 함수 (PDF는 _convert_pdf_to_images)
+    _IMAGE_CONVERTERS = {
+        '.tif': '_convert_tiff_to_images',
+        '.tiff': '_convert_tiff_to_images',
+        '.png': '_convert_single_image',
+        '.jpg': '_convert_single_image',
+        '.jpeg': '_convert_single_image',
+        '.bmp': '_convert_single_image',
+        '.webp': '_convert_single_image',
+    }
+
+    def _convert_single_image(self, image_path: Path) -> List[np.ndarray]:
+        """단일 이미지 파일 디코딩
+
+        OpenCV가 있으면 libjpeg-turbo/libpng 경로로 바로 BGR uint8 배열로 디코딩한 뒤 RGB로 변환한다.
+        cv2.imread는 Windows에서 한글 경로를 읽지 못하므로 파일을 읽어 imdecode로 디코딩한다.
+        """
+        if CV2_AVAILABLE:
+            import cv2
+            image = cv2.imdecode(np.fromfile(str(image_path), dtype=np.uint8), cv2.IMREAD_COLOR)
+            if image is not None:
+                return [cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)]
+
+        # OpenCV가 없거나 디코딩할 수 없는 형식은 PIL로 처리
+        with Image.open(image_path) as image:
+            return [self._as_rgb_uint8(image)]
+
+    def _convert_tiff_to_images(self, tiff_path: Path) -> List[np.ndarray]:
+        """TIFF 디코딩 (다중 페이지 TIFF는 페이지별 이미지)"""
+        with Image.open(tiff_path) as image:
+            return [self._as_rgb_uint8(frame) for frame in ImageSequence.Iterator(image)]
+
+    async def _convert_document_to_images(self, document_path: Union[str, Path]) -> Tuple[List[np.ndarray], List[float]]:
+        """문서를 페이지별 이미지로 변환 (이미지, 페이지별 렌더링 배율) 반환"""
         document_path = Path(document_path)
-        images = []
+        images, scales = [], []
 
         try:
-            if document_path.suffix.lower() == '.pdf':
-                images = await self._convert_pdf_to_images(document_path)
+            suffix = document_path.suffix.lower()
+            if suffix == '.pdf':
+                images, scales = await self._convert_pdf_to_images(document_path)
             else:
-                # 다른 형식은 PIL로 처리
-                image = Image.open(document_path)
-                images = [np.array(image)]
+                # 이미지 파일은 확장자별 변환 함수로 디코딩 (스레드에서 수행, 알 수 없는 형식은 단일 이미지로 처리)
+                convert = getattr(self, self._IMAGE_CONVERTERS.get(suffix, '_convert_single_image'))
+                images = await asyncio.to_thread(convert, document_path)
+                scales = [1.0] * len(images)
 
         except Exception as e:
             logger.error(f"문서 이미지 변환 실패: {e}")
 
-        return images
+        return images, scales
 
-    async def _convert_pdf_to_images(self, pdf_path: Path) -> List[np.ndarray]:
-        """PDF를 이미지로 변환"""
-        images = []
+    async def _convert_pdf_to_images(self, pdf_path: Path) -> Tuple[List[np.ndarray], List[float]]:
+        """PDF를 이미지로 변환 (페이지별로 스레드에서 병렬 렌더링)"""
+        images, scales = [], []
 
         try:
             import fitz  # PyMuPDF
 
-            doc = fitz.open(str(pdf_path))
+            with fitz.open(str(pdf_path)) as doc:
+                page_count = len(doc)
 
-            for page_num in range(len(doc)):
-                page = doc[page_num]
+            # 검출 모델 입력 크기에 맞춘 해상도로 렌더링 (고정 2배 확대 시 A4 기준 약 4배 픽셀)
+            side_len = self._render_side_len()
+            rendered = await asyncio.gather(*(
+                asyncio.to_thread(self._render_pdf_page, pdf_path, page_num, side_len)
+                for page_num in range(page_count)
+            ))
+            images = [image for image, _ in rendered]
+            scales = [zoom for _, zoom in rendered]
 
-                # 적절한 해상도로 렌더링
-                mat = fitz.Matrix(2.0, 2.0)  # 2배 확대 (200 DPI 정도)
-                pix = page.get_pixmap(matrix=mat)
+        except ImportError:
+            logger.error("PyMuPDF(fitz)가 설치되지 않았습니다.")
+        except Exception as e:
+            logger.error(f"PDF 이미지 변환 실패: {e}")
 
-                # numpy 배열로 변환
-                img_data = pix.samples
-                img_array = np.frombuffer(img_data, dtype=np.uint8)
-                img_array = img_array.reshape(pix.height, pix.width, pix.n)
+        return images, scales
 
-                # RGB로 변환 (필요한 경우)
-                if pix.n == 4:  # RGBA
-                    img_array = img_array[:, :, :3]  # A 채널 제거
+    async def _iter_pdf_pages(self, pdf_path: Path, prefetch: int = PDF_PREFETCH_PAGES):
+        """PDF 페이지를 렌더링되는 순서대로 (페이지 번호, 이미지, 배율)로 반환
 
-                images.append(img_array)
+        렌더링은 별도 태스크가 스레드에서 미리 수행하고, 큐 크기(prefetch)로 대기 중인 페이지 수를 제한한다.
+        """
+        import fitz  # PyMuPDF
 
-            doc.close()
+        with fitz.open(str(pdf_path)) as doc:
+            page_count = len(doc)
 
-        except ImportError:
-            logger.error("PyMuPDF(fitz)가 설치되지 않았습니다.")
-        except Exception as e:
-            logger.error(f"PDF 이미지 변환 실패: {e}")
+        side_len = self._render_side_len()
+        queue = asyncio.Queue(maxsize=prefetch)
+
+        async def render_pages():
+            try:
+                for page_num in range(page_count):
+                    image, zoom = await asyncio.to_thread(self._render_pdf_page, pdf_path, page_num, side_len)
+                    await queue.put((page_num, image, zoom))
+            except Exception as e:
+                await queue.put(e)  # 소비 측에서 다시 발생
+            else:
+                await queue.put(None)  # 종료 표시
+
+        producer = asyncio.create_task(render_pages())
+        try:
+            while (item := await queue.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+
+    def _render_side_len(self) -> int:
+        """PDF 렌더링 목표 해상도 (긴 변 픽셀)"""
+        if self.config:
+            return getattr(self.config.ocr, 'render_side_len', DEFAULT_RENDER_SIDE_LEN) or DEFAULT_RENDER_SIDE_LEN
+        return DEFAULT_RENDER_SIDE_LEN
+
+    @staticmethod
+    def _render_pdf_page(pdf_path: Path, page_num: int, side_len: int) -> Tuple[np.ndarray, float]:
+        """PDF 한 페이지를 RGB 배열로 렌더링 (이미지, 적용 배율) 반환
+
+        긴 변이 side_len 픽셀이 되도록 배율을 정하고 RENDER_ZOOM_RANGE로 제한한다.
+        fitz 문서 객체는 스레드 간 공유가 안전하지 않으므로 호출마다 새로 연다.
+        alpha=False + RGB 색공간으로 렌더링해 알파 채널 제거용 복사를 없애고,
+        Pixmap 버퍼를 bytes로 복사하지 않고 그대로 배열로 사용한다.
+        """
+        import fitz  # PyMuPDF
+
+        with fitz.open(str(pdf_path)) as doc:
+            page = doc[page_num]
+            rect = page.rect
+            min_zoom, max_zoom = RENDER_ZOOM_RANGE
+            zoom = min(max(side_len / max(rect.width, rect.height, 1.0), min_zoom), max_zoom)
+            pix = page.get_pixmap(
+                matrix=fitz.Matrix(zoom, zoom), alpha=False, colorspace=fitz.csRGB
+            )
 
-        return images
+        return _PixmapImage.from_pixmap(pix), zoom
+
+    def _loaded_paddle_cuda(self):
+        """GPU에서 이미 로드된 paddle 모듈 (정리만을 위해 새로 임포트하지 않음)"""
+        if not self.current_device.startswith("cuda"):
+            return None
+        return sys.modules.get('paddle')
 
     def cleanup_memory(self):
-        """메모리 정리"""
+        """메모리 정리 (torch 캐시와 Paddle GPU 할당기 캐시)"""
         if self.device_manager:
             self.device_manager.cleanup_memory(self.current_device)
+        else:
+            gc.collect()
+
+        paddle = self._loaded_paddle_cuda()
+        if paddle is not None:
+            try:
+                paddle.device.cuda.empty_cache()
+            except Exception as e:
+                logger.debug(f"Paddle GPU 메모리 캐시 정리 실패: {e}")
+
+    @asynccontextmanager
+    async def _paddle_memory_scope(self, label: str):
+        """문서 하나를 처리하는 구간: 끝나면 메모리를 정리하고, 남은 Paddle GPU 할당량이 크면 경고
+
+        동시에 여러 문서를 처리하면 다른 문서의 할당이 함께 집계될 수 있다.
+        """
+        paddle = self._loaded_paddle_cuda()
+        before = 0
+        if paddle is not None:
+            try:
+                before = paddle.device.cuda.memory_allocated()
+            except Exception:
+                paddle = None
+
+        try:
+            yield
+        finally:
+            self.cleanup_memory()
+            if paddle is not None:
+                try:
+                    retained_mb = (paddle.device.cuda.memory_allocated() - before) / (1024 ** 2)
+                    if retained_mb > PADDLE_RETAINED_WARN_MB:
+                        logger.warning(f"문서 처리 후 Paddle GPU 메모리 {retained_mb:.0f}MB 미반환: {label}")
+                except Exception as e:
+                    logger.debug(f"Paddle GPU 메모리 사용량 조회 실패: {e}")
 
     def get_processing_stats(self) -> Dict[str, Any]:
         """처리 통계 반환"""
         return {
             "current_device": self.current_device,
             "available_analyzers": self.available_analyzers,
+            "analyzers_initialized": self._analyzers_initialized,
             "paddlex_enabled": self.paddlex_pipeline is not None,
             "paddleocr_enabled": self.paddleocr_analyzer is not None,
-            "docling_enabled": self.docling_analyzer is not None
+            "docling_enabled": self.docling_analyzer is not None,
+            "result_cache": ("off" if self._result_cache is None
+                             else "memory" if isinstance(self._result_cache, dict) else "disk"),
+            "result_cache_hits": self._cache_hits,
+            "result_cache_misses": self._cache_misses,
+            "blank_pages_skipped": self._blank_pages_skipped
         }
 
     async def batch_analyze(self,
                            document_paths: List[Union[str, Path]]) -> List[LayoutAnalysisResult]:
         """배치 레이아웃 분석"""
-        results = []
-
-        for doc_path in document_paths:
-            try:
-                result = await self.analyze_document(doc_path)
-                results.append(result)
-
-                # 메모리 정리 (필요한 경우)
-                if len(results) % 10 == 0:
-                    self.cleanup_memory()
-
-            except Exception as e:
-                error_result = LayoutAnalysisResult(
-                    success=False,
-                    error=str(e)
-                )
-                results.append(error_result)
-
-        return results
\ No newline at end of file
+        semaphore = asyncio.Semaphore(self._max_concurrent())
+
+        async def analyze_one(doc_path: Union[str, Path]) -> LayoutAnalysisResult:
+            # 문서마다 메모리 정리 (Paddle 할당기가 문서별로 잡은 메모리가 누적되지 않도록)
+            async with semaphore, self._paddle_memory_scope(str(doc_path)):
+                try:
+                    return await self.analyze_document(doc_path)
+                except Exception as e:
+                    return LayoutAnalysisResult(
+                        success=False,
+                        error=str(e)
+                    )
+
+        # 문서별 분석을 동시 실행 수 제한 내에서 병렬 처리 (결과는 입력 순서 유지)
+        # 모델 추론 호출 자체는 문서와 관계없이 _inference_slots로 제한됨
+        return list(await asyncio.gather(*(analyze_one(doc_path) for doc_path in document_paths)))
\ No newline at end of file
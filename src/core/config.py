@@ -3,6 +3,7 @@ Configuration Management System
 CPU/GPU 듀얼 모드 지원을 위한 설정 관리
 """
 
+import copy
 import os
 import yaml
 import torch
@@ -11,6 +12,16 @@ from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
+# libyaml 기반 C 로더/덤퍼 (없으면 순수 Python 구현)
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+
+# 파싱한 설정 파일 캐시 ((경로, 수정 시각, 크기) -> 설정 dict), 파일이 바뀌지 않았으면 다시 파싱하지 않음
+_YAML_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
 
 class ProcessingMode(Enum):
     """처리 모드"""
@@ -50,6 +61,12 @@ class OCRConfig:
     det_model: str = "ch_PP-OCRv4_det"
     rec_model: str = "ch_PP-OCRv4_rec"
     cls_model: str = "ch_ppocr_mobile_v2.0_cls"
+    rec_batch_num: int = 6  # 인식 배치 크기 (GPU에서만 적용, CPU는 항상 1)
+    use_tensorrt: bool = False  # CUDA에서 TensorRT(FP16) 엔진 사용 (명시적으로 켠 경우에만)
+    max_concurrent: int = 1  # 동시에 OCR 처리할 최대 페이지/문서 수
+    render_side_len: int = 1680  # PDF 렌더링 목표 해상도 (긴 변 픽셀, OCR 검출 모델 설정과는 별개)
+    skip_blank_pages: bool = False  # 빈 페이지 OCR 생략 (명시적으로 켠 경우에만)
+    layout_result_cache: str = "memory"  # 레이아웃 분석 결과 캐시: "memory", "disk", "off"
 
 
 @dataclass
@@ -133,15 +150,22 @@ class ConfigManager:
 
         config_path = config_dir / "config.yaml"
         with open(config_path, 'w') as f:
-            yaml.dump(default_config, f, default_flow_style=False)
+            yaml.dump(default_config, f, Dumper=SafeDumper, default_flow_style=False)
 
         return str(config_path)
 
     def _load_config(self) -> Dict[str, Any]:
-        """설정 파일 로드"""
+        """설정 파일 로드 (변경되지 않은 파일은 캐시된 파싱 결과 사용)"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            st = os.stat(self.config_path)
+            key = (os.path.abspath(self.config_path), st.st_mtime_ns, st.st_size)
+            data = _YAML_CACHE.get(key)
+            if data is None:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    data = yaml.load(f, Loader=SafeLoader)
+                _YAML_CACHE[key] = data
+            # 설정 값(lang 리스트 등)이 설정 객체를 통해 수정되어도 캐시에 영향이 없도록 복사본 반환
+            return copy.deepcopy(data)
         except Exception as e:
             print(f"설정 파일 로드 실패: {e}")
             return {}
@@ -209,13 +233,20 @@ class ConfigManager:
     def _create_ocr_config(self) -> OCRConfig:
         """OCR 설정 생성"""
         ocr_config = self._config_data.get("ocr", {}).get("paddleocr", {})
+        layout_config = self._config_data.get("ocr", {}).get("layout_analysis", {})
 
         return OCRConfig(
             use_gpu=ocr_config.get("use_gpu", False) and self._system_info["has_cuda"],
             lang=ocr_config.get("lang", ["ko", "en"]),
             det_model=ocr_config.get("det_model", "ch_PP-OCRv4_det"),
             rec_model=ocr_config.get("rec_model", "ch_PP-OCRv4_rec"),
-            cls_model=ocr_config.get("cls_model", "ch_ppocr_mobile_v2.0_cls")
+            cls_model=ocr_config.get("cls_model", "ch_ppocr_mobile_v2.0_cls"),
+            rec_batch_num=ocr_config.get("rec_batch_num", 6),
+            use_tensorrt=ocr_config.get("use_tensorrt", False),
+            max_concurrent=ocr_config.get("max_concurrent", 1),
+            render_side_len=ocr_config.get("render_side_len", 1680),
+            skip_blank_pages=ocr_config.get("skip_blank_pages", False),
+            layout_result_cache=layout_config.get("result_cache", "memory")
         )
 
     def _create_embedding_config(self) -> EmbeddingConfig:
@@ -315,7 +346,15 @@ class ConfigManager:
                     "use_gpu": self.ocr.use_gpu,
                     "lang": self.ocr.lang,
                     "det_model": self.ocr.det_model,
-                    "rec_model": self.ocr.rec_model
+                    "rec_model": self.ocr.rec_model,
+                    "rec_batch_num": self.ocr.rec_batch_num,
+                    "use_tensorrt": self.ocr.use_tensorrt,
+                    "max_concurrent": self.ocr.max_concurrent,
+                    "render_side_len": self.ocr.render_side_len,
+                    "skip_blank_pages": self.ocr.skip_blank_pages
+                },
+                "layout_analysis": {
+                    "result_cache": self.ocr.layout_result_cache
                 }
             },
             "embeddings": {
@@ -329,7 +368,7 @@ class ConfigManager:
         }
 
         with open(save_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config_dict, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(config_dict, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
 
 
 # 전역 설정 인스턴스
@@ -2,6 +2,7 @@
 Device Manager - CPU/GPU 자동 관리 및 최적화
 """
 
+import functools
 import torch
 import psutil
 import platform
@@ -425,13 +426,10 @@ class DeviceManager:
                   f"{device.name} - {memory_info}{compute_info}")
 
 
-# 전역 디바이스 매니저 인스턴스
-device_manager = DeviceManager()
-
-
+@functools.lru_cache(maxsize=1)
 def get_device_manager() -> DeviceManager:
-    """디바이스 매니저 인스턴스 반환"""
-    return device_manager
+    """프로세스 전역 디바이스 매니저 반환 (하드웨어는 실행 중 바뀌지 않으므로 최초 호출 시 한 번만 감지)"""
+    return DeviceManager()
 
 
 if __name__ == "__main__":
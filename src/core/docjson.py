@@ -14,6 +14,13 @@ import json
 import jsonschema
 from jsonschema import validate, ValidationError
 
+# 빠른 JSON 직렬화 (선택)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..analyzers.layout_analyzer import LayoutElement, LayoutElementType
 from ..extractors.content_extractor import ExtractedContent
 
@@ -810,9 +817,14 @@ class DocJSONConverter:
                 logger.error("DocJSON 검증 실패로 저장하지 않습니다.")
                 return False
 
-            # 파일 저장
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(docjson_dict, f, indent=2, ensure_ascii=False)
+            # 파일 저장 (orjson은 UTF-8 바이트를 직접 생성하므로 재인코딩 없음)
+            if ORJSON_AVAILABLE:
+                output_path.write_bytes(
+                    orjson.dumps(docjson_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(docjson_dict, f, indent=2, ensure_ascii=False)
 
             logger.info(f"DocJSON 저장 완료: {output_path}")
             return True
@@ -20,7 +20,7 @@ from ..core.docjson import DocJSON
 from ..core.vectorization_engine import VectorizationEngine, VectorDocument
 from ..core.user_annotations import UserAnnotationManager, DocumentAnnotation
 from ..core.template_manager import TemplateManager, TemplateMatchResult
-from ..core.device_manager import DeviceManager
+from ..core.device_manager import DeviceManager, get_device_manager
 from ..core.simplified_config import (
     SimplifiedConfigManager, PipelineConfig, ProcessingPreset,
     ProcessingLevel, DocumentFormat, ConfigValidation
@@ -78,7 +78,7 @@ class ModernizedPipeline:
         self.output_dir = Path(output_dir or "pipeline_output")
         self.output_dir.mkdir(exist_ok=True)
 
-        self.device_manager = device_manager or DeviceManager()
+        self.device_manager = device_manager or get_device_manager()
         self.config_manager = config_manager or SimplifiedConfigManager()
 
         # 핵심 컴포넌트들 - 통합된 파서 사용
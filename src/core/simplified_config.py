@@ -170,9 +170,9 @@ class SimplifiedConfigManager:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipelineConfig:
-    """단순화된 파이프라인 설정"""
+    """단순화된 파이프라인 설정 (불변 - 배치 처리 시 여러 작업이 공유)"""
     processing_level: ProcessingLevel = ProcessingLevel.STANDARD
     document_format: DocumentFormat = DocumentFormat.AUTO
     custom_template_id: Optional[str] = None
@@ -287,14 +287,9 @@ def migrate_legacy_config(legacy_config: Dict[str, Any]) -> PipelineConfig:
     processing_mode = legacy_config.get('processing_mode', 'enhanced')
     level = mode_mapping.get(processing_mode, ProcessingLevel.STANDARD)
 
-    config = PipelineConfig(processing_level=level)
-
-    # 템플릿 임계값 마이그레이션
-    if 'template_confidence_threshold' in legacy_config:
-        config.override_template_threshold = legacy_config['template_confidence_threshold']
-
-    # 출력 형식 마이그레이션
-    if 'output_formats' in legacy_config:
-        config.override_output_formats = legacy_config['output_formats']
-
-    return config
\ No newline at end of file
+    # 템플릿 임계값 / 출력 형식 마이그레이션 (PipelineConfig는 불변이므로 생성 시 지정)
+    return PipelineConfig(
+        processing_level=level,
+        override_template_threshold=legacy_config.get('template_confidence_threshold'),
+        override_output_formats=legacy_config.get('output_formats')
+    )
\ No newline at end of file
@@ -105,7 +105,7 @@ async def step3_annotation_creation():
     print()
 
     # 6. 수동 편집 데모
-    await demonstrate_manual_editing(annotation_manager, auto_annotation)
+    demonstrate_manual_editing(annotation_manager, auto_annotation)
 
     return {
         'annotation': auto_annotation,
@@ -115,7 +115,7 @@ async def step3_annotation_creation():
         'critical_fields_count': len(critical_fields)
     }
 
-async def demonstrate_manual_editing(annotation_manager, annotation):
+def demonstrate_manual_editing(annotation_manager, annotation):
     """수동 편집 데모"""
     print("🛠️ 수동 편집 데모:")
     print("   (실제 GUI는 향후 구현 예정, 현재는 프로그래밍 방식으로 편집)")
@@ -194,7 +194,7 @@ async def demonstrate_manual_editing(annotation_manager, annotation):
             print(f"      ⚠️ {warning}")
     print()
 
-async def demonstrate_bbox_editing():
+def demonstrate_bbox_editing():
     """바운딩박스 편집 고급 예시"""
     print("🎨 바운딩박스 편집 고급 기능:")
     print("   (향후 구현될 GUI 기능들)")
@@ -227,4 +227,4 @@ if __name__ == "__main__":
 
         # 고급 편집 기능 데모
         print("\n🎨 고급 편집 기능 (향후 구현):")
-        asyncio.run(demonstrate_bbox_editing())
\ No newline at end of file
+        demonstrate_bbox_editing()
\ No newline at end of file
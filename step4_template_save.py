@@ -79,10 +79,10 @@ async def step4_template_creation():
         print()
 
         # 3. 템플릿 JSON 형식으로 변환 및 저장
-        await save_user_template_as_json(user_template, annotation)
+        await asyncio.to_thread(save_user_template_as_json, user_template, annotation)
 
         # 4. 기존 템플릿과 비교
-        await compare_with_existing_templates(user_template)
+        await asyncio.to_thread(compare_with_existing_templates, user_template)
 
         return {
             'user_template': user_template,
@@ -93,7 +93,7 @@ async def step4_template_creation():
         print("❌ 자동 템플릿 생성 실패")
         return None
 
-async def save_user_template_as_json(user_template, annotation):
+def save_user_template_as_json(user_template, annotation):
     """사용자 템플릿을 JSON 형식으로 저장"""
     print("💾 템플릿을 JSON 형식으로 저장...")
 
@@ -215,7 +215,7 @@ def _infer_location_from_bbox(bbox):
     else:
         return "center"
 
-async def compare_with_existing_templates(user_template):
+def compare_with_existing_templates(user_template):
     """기존 템플릿과 비교"""
     print("🔍 기존 템플릿과 비교...")
 
@@ -253,7 +253,7 @@ def _calculate_similarity(new_count, existing_count):
     larger = max(new_count, existing_count)
     return smaller / larger
 
-async def demonstrate_template_management():
+def demonstrate_template_management():
     """템플릿 관리 기능 데모"""
     print("🗂️ 템플릿 관리 기능:")
     print()
@@ -305,4 +305,4 @@ if __name__ == "__main__":
 
         # 템플릿 관리 기능 데모
         print("\n🗂️ 템플릿 관리 시스템:")
-        asyncio.run(demonstrate_template_management())
\ No newline at end of file
+        demonstrate_template_management()
\ No newline at end of file
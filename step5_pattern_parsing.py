@@ -54,19 +54,19 @@ async def step5_final_parsing():
     print()
 
     # 2. 템플릿 매칭 결과 분석
-    await analyze_template_matching(result)
+    analyze_template_matching(result)
 
     # 3. 패턴 인식 결과 분석
-    await analyze_pattern_recognition(result)
+    analyze_pattern_recognition(result)
 
     # 4. 하이브리드 파싱 결과 분석
-    await analyze_hybrid_parsing(result)
+    analyze_hybrid_parsing(result)
 
     # 5. 품질 평가 및 개선점
-    await analyze_quality_assessment(result)
+    analyze_quality_assessment(result)
 
     # 6. 최종 결과 검증
-    await verify_final_results(result)
+    verify_final_results(result)
 
     return {
         'result': result,
@@ -75,7 +75,7 @@ async def step5_final_parsing():
         'extracted_fields': len(result.template_match.matched_fields) if result.template_match else 0
     }
 
-async def analyze_template_matching(result):
+def analyze_template_matching(result):
     """템플릿 매칭 결과 분석"""
     print("📋 템플릿 매칭 결과 분석:")
 
@@ -110,7 +110,7 @@ async def analyze_template_matching(result):
         print("   ❌ 템플릿 매칭 실패")
         print()
 
-async def analyze_pattern_recognition(result):
+def analyze_pattern_recognition(result):
     """패턴 인식 결과 분석"""
     print("🔍 패턴 인식 결과 분석:")
 
@@ -158,7 +158,7 @@ async def analyze_pattern_recognition(result):
         print(f"     • {sec_type}: {count}개")
     print()
 
-async def analyze_hybrid_parsing(result):
+def analyze_hybrid_parsing(result):
     """하이브리드 파싱 결과 분석"""
     print("🔀 하이브리드 파싱 결과 분석:")
 
@@ -196,7 +196,7 @@ async def analyze_hybrid_parsing(result):
         print(f"     추론 기반: {inference_ratio:.1%}")
         print()
 
-async def analyze_quality_assessment(result):
+def analyze_quality_assessment(result):
     """품질 평가 및 개선점 분석"""
     print("📈 품질 평가 및 개선점:")
 
@@ -228,7 +228,7 @@ async def analyze_quality_assessment(result):
             print(f"     • 템플릿 패턴 정교화 필요")
     print()
 
-async def verify_final_results(result):
+def verify_final_results(result):
     """최종 결과 검증"""
     print("✅ 최종 결과 검증:")
 
@@ -304,7 +304,7 @@ async def verify_final_results(result):
         print("     🔴 개선 필요 - 추가 개발 필요")
     print()
 
-async def demonstrate_advanced_features():
+def demonstrate_advanced_features():
     """고급 기능 데모"""
     print("🚀 고급 기능 및 향후 계획:")
     print()
@@ -350,4 +350,4 @@ if __name__ == "__main__":
 
         # 고급 기능 데모
         print("\n🚀 시스템 고도화 방향:")
-        asyncio.run(demonstrate_advanced_features())
\ No newline at end of file
+        demonstrate_advanced_features()
\ No newline at end of file
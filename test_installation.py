@@ -132,18 +132,19 @@ def check_system_command(command, name=None):
     if name is None:
         name = command.split()[0]
 
+    # 종료 코드만 확인하므로 출력은 버림 (파이프/디코딩 불필요)
     try:
         if sys.platform == "win32":
             result = subprocess.run(f"where {command.split()[0]}",
-                                  shell=True, capture_output=True, text=True)
+                                  shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         else:
             result = subprocess.run(f"which {command.split()[0]}",
-                                  shell=True, capture_output=True, text=True)
+                                  shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
         if result.returncode == 0:
             # 버전 확인 시도
             version_result = subprocess.run(command,
-                                          shell=True, capture_output=True, text=True)
+                                          shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             if version_result.returncode == 0:
                 print(f"  ✅ {name} 설치 확인")
                 return True
@@ -0,0 +1,145 @@
+"""
+LayoutAnalyzer 테스트 - PaddleOCR 추론을 가짜 객체로 대체해 모델 없이 실행
+"""
+
+import asyncio
+
+import numpy as np
+
+from src.analyzers import layout_analyzer
+from src.analyzers.layout_analyzer import LayoutAnalyzer
+
+
+def _text_page() -> np.ndarray:
+    """흰 바탕에 글자 영역(검은 사각형)이 있는 RGB 페이지"""
+    page = np.full((200, 150, 3), 255, dtype=np.uint8)
+    page[20:30, 10:120] = 0
+    return page
+
+
+class _FlakyOCR:
+    """처음 failures번은 GPU 메모리 부족 오류를 내고 이후에는 한 줄을 인식하는 PaddleOCR 대역"""
+
+    def __init__(self, failures: int = 1):
+        self.failures = failures
+        self.calls = 0
+
+    def ocr(self, image):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("CUDA error: out of memory")
+        return [[[[[10, 20], [120, 20], [120, 30], [10, 30]], ("본문", 0.95)]]]
+
+
+def _paddleocr_analyzer(ocr) -> LayoutAnalyzer:
+    analyzer = LayoutAnalyzer()
+    analyzer._analyzers_initialized = True
+    analyzer.paddleocr_analyzer = ocr
+    return analyzer
+
+
+async def _no_sleep(delay):
+    return None
+
+
+def test_paddleocr_retries_transient_page_error(monkeypatch):
+    monkeypatch.setattr(layout_analyzer.asyncio, "sleep", _no_sleep)
+    ocr = _FlakyOCR(failures=1)
+    analyzer = _paddleocr_analyzer(ocr)
+
+    result = asyncio.run(analyzer.analyze_document("page.png", page_images=[_text_page()]))
+
+    assert result.success
+    assert result.attempts == 2
+    assert result.failed_pages == 0
+    assert [element.text for element in result.elements] == ["본문"]
+    assert ocr.calls == 2
+
+
+def test_paddleocr_non_transient_page_error_is_not_retried(monkeypatch):
+    monkeypatch.setattr(layout_analyzer.asyncio, "sleep", _no_sleep)
+
+    class _BrokenOCR:
+        calls = 0
+
+        def ocr(self, image):
+            self.calls += 1
+            raise ValueError("invalid image")
+
+    ocr = _BrokenOCR()
+    analyzer = _paddleocr_analyzer(ocr)
+
+    result = asyncio.run(analyzer.analyze_document("page.png", page_images=[_text_page()]))
+
+    assert result.success
+    assert result.attempts == 1
+    assert result.failed_pages == 1
+    assert ocr.calls == 1
+
+
+def _blank_page() -> np.ndarray:
+    """스캔 티끌 몇 개만 있는 빈 A4 페이지 (렌더링 해상도 기준)"""
+    page = np.full((1680, 1188, 3), 255, dtype=np.uint8)
+    page[100, 100] = page[900, 700] = page[1500, 300] = 40
+    return page
+
+
+def _sparse_page() -> np.ndarray:
+    """하단 중앙에 쪽번호 한 글자만 있는 페이지"""
+    page = np.full((1680, 1188, 3), 255, dtype=np.uint8)
+    page[1600:1620, 590:593] = 0  # 세로획
+    page[1618:1620, 585:598] = 0  # 받침
+    return page
+
+
+def test_blank_page_detection_keeps_sparse_pages():
+    assert LayoutAnalyzer._is_blank_page(_blank_page())
+    assert not LayoutAnalyzer._is_blank_page(_sparse_page())
+    assert not LayoutAnalyzer._is_blank_page(_text_page())
+
+
+def test_blank_pages_are_analyzed_unless_enabled():
+    pages = [_blank_page(), _sparse_page()]
+
+    ocr = _FlakyOCR(failures=0)
+    result = asyncio.run(_paddleocr_analyzer(ocr).analyze_document("pages.png", page_images=pages))
+    assert result.success
+    assert ocr.calls == 2
+
+    ocr = _FlakyOCR(failures=0)
+    analyzer = _paddleocr_analyzer(ocr)
+    analyzer._skip_blank_pages = True
+    result = asyncio.run(analyzer.analyze_document("pages.png", page_images=pages))
+    assert result.success
+    assert ocr.calls == 1
+    assert analyzer.get_processing_stats()["blank_pages_skipped"] == 1
+
+
+def test_result_cache_defaults_to_memory():
+    analyzer = LayoutAnalyzer()
+    assert analyzer._result_cache == {}
+    assert analyzer.get_processing_stats()["result_cache"] == "memory"
+
+    analyzer._cache_set("key", ([], 1, [1.0]))
+    analyzer.clear_result_cache()
+    assert analyzer._cache_get("key") is None
+
+
+def test_paddleocr_page_normalizes_input_image():
+    class _RecordingOCR:
+        def ocr(self, image):
+            self.image = image
+            return [[]]
+
+    ocr = _RecordingOCR()
+    analyzer = _paddleocr_analyzer(ocr)
+
+    gray = np.full((40, 30), 255, dtype=np.uint8)
+    assert analyzer._process_page_with_paddleocr(gray, 0) == []
+    assert ocr.image.shape == (40, 30, 3) and ocr.image.dtype == np.uint8
+
+    page = _text_page()
+    analyzer._process_page_with_paddleocr(page, 0)
+    assert ocr.image is page
+
+    assert analyzer._process_page_with_paddleocr(np.zeros((4, 4, 5), dtype=np.uint8), 0) is None